@@ -38,6 +38,7 @@ from microsoft_agents.activity import load_configuration_from_env, Activity
 
 # Import our agent base class
 from agent_interface import AgentInterface, check_agent_inheritance
+from observability_config import initialize_observability
 
 # Configure logging
 ms_agents_logger = logging.getLogger("microsoft_agents")
@@ -567,6 +568,9 @@ def create_and_run_host(agent_class: type[AgentInterface], *agent_args, **agent_
         if not check_agent_inheritance(agent_class):
             raise TypeError(f"Agent class {agent_class.__name__} must inherit from AgentInterface")
 
+        # Configure observability once, before the agent is instantiated
+        initialize_observability()
+
         # Create the host
         host = GenericAgentHost(agent_class, *agent_args, **agent_kwargs)
 
@@ -5,12 +5,14 @@
 Observability Configuration Module
 
 Handles one-time initialization of Agent 365 Observability SDK.
-This module should be imported early in the application lifecycle to ensure
-observability is configured before any agents are instantiated.
+initialize_observability() is called by create_and_run_host() before any agents
+are instantiated; repeated calls are no-ops, and importing this module has no
+side effects.
 """
 
 import logging
 import os
+from threading import Lock
 
 from microsoft_agents_a365.observability.core.config import configure
 from token_cache import get_cached_agentic_token
@@ -20,9 +22,30 @@ logger = logging.getLogger(__name__)
 # Flag to track if observability has been configured
 _observability_configured = False
 
+# Serializes the first configuration so concurrent callers cannot both configure
+_configure_lock = Lock()
+
+# token_resolver logs the first missing token, then one per this many misses (power of two minus one)
+TOKEN_RESOLVER_LOG_SAMPLE_MASK = 1023
+_token_misses = 0
+
+# BatchSpanProcessor defaults sized for bursty agent traffic; explicit
+# OTEL_BSP_* environment variables still take precedence
+_BSP_ENV_DEFAULTS = {
+    "OTEL_BSP_MAX_QUEUE_SIZE": "4096",
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": "512",
+    "OTEL_BSP_SCHEDULE_DELAY": "2000",
+}
+
+
+def initialize_observability() -> bool:
+    """Initialize observability SDK once, before any agent instances are created"""
+    with _configure_lock:
+        return _initialize_observability_once()
+
 
 def _initialize_observability_once() -> bool:
-    """Initialize observability SDK once at module level before any agent instances are created"""
+    """Configure the SDK unless already configured; callers hold _configure_lock"""
     global _observability_configured
 
     if _observability_configured:
@@ -30,21 +53,29 @@ def _initialize_observability_once() -> bool:
         return True
 
     def token_resolver(agent_id: str, tenant_id: str) -> str | None:
-        """Token resolver for Agent 365 Observability exporter"""
+        """Token resolver for Agent 365 Observability exporter (runs on every export)"""
+        global _token_misses
+
         try:
-            logger.info(f"Token resolver called for agent_id: {agent_id}, tenant_id: {tenant_id}")
             cached_token = get_cached_agentic_token(tenant_id, agent_id)
-            if cached_token:
-                logger.info("Using cached agentic token from agent authentication")
-                return cached_token
-            logger.warning(
-                f"No cached agentic token found for agent_id: {agent_id}, tenant_id: {tenant_id}"
-            )
-            return None
         except Exception as e:
-            logger.error(f"Error resolving token for agent {agent_id}, tenant {tenant_id}: {e}")
+            logger.error("Error resolving token for agent %s, tenant %s: %s", agent_id, tenant_id, e)
             return None
 
+        if cached_token is None:
+            _token_misses += 1
+            if ((_token_misses - 1) & TOKEN_RESOLVER_LOG_SAMPLE_MASK) == 0:
+                logger.warning(
+                    "No cached agentic token found for agent_id: %s, tenant_id: %s (%d miss(es) so far)",
+                    agent_id,
+                    tenant_id,
+                    _token_misses,
+                )
+        return cached_token
+
+    for name, value in _BSP_ENV_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+
     try:
         status = configure(
             service_name=os.getenv("OBSERVABILITY_SERVICE_NAME", "claude-sample-agent"),
@@ -61,14 +92,10 @@ def _initialize_observability_once() -> bool:
         return True
 
     except Exception as e:
-        logger.error(f"❌ Error setting up observability: {e}")
+        logger.error("❌ Error setting up observability: %s", e)
         return False
 
 
 def is_observability_configured() -> bool:
     """Check if observability has been configured"""
     return _observability_configured
-
-
-# Initialize observability immediately at module load time
-_initialize_observability_once()
@@ -26,7 +26,7 @@ def cache_agentic_token(tenant_id: str, agent_id: str, token: str) -> None:
     """
     cache_key = f"{tenant_id}:{agent_id}"
     _token_cache[cache_key] = token
-    logger.debug(f"Cached agentic token for {cache_key}")
+    logger.debug("Cached agentic token for %s", cache_key)
 
 
 def get_cached_agentic_token(tenant_id: str, agent_id: str) -> str | None:
@@ -44,9 +44,9 @@ def get_cached_agentic_token(tenant_id: str, agent_id: str) -> str | None:
     token = _token_cache.get(cache_key)
 
     if token:
-        logger.debug(f"Retrieved cached token for {cache_key}")
+        logger.debug("Retrieved cached token for %s", cache_key)
     else:
-        logger.debug(f"No cached token found for {cache_key}")
+        logger.debug("No cached token found for %s", cache_key)
 
     return token
 
@@ -11,7 +11,6 @@ This keeps the CrewAI logic inside src/crew_agent and wraps it with:
 """
 
 import asyncio
-import contextvars
 import logging
 import os
 
@@ -37,7 +36,12 @@ from mcp_tool_registration_service import McpToolRegistrationService, MCPToolDef
 from microsoft_agents.hosting.core import Authorization, TurnContext
 
 # MCP Observable Tools
-from mcp_observable_tools import MCPToolExecutor, create_observable_mcp_tools
+from mcp_observable_tools import (
+    MCPToolExecutor,
+    create_observable_mcp_tools,
+    current_agent_details,
+    current_tenant_details,
+)
 
 # Notification Handler
 from notification_handler import handle_notification
@@ -53,21 +57,11 @@ from microsoft_agents_a365.observability.core import (
 # Shared turn context utilities
 from turn_context_utils import (
     extract_turn_context_details,
-    create_agent_details,
-    create_invoke_agent_details,
-    create_caller_details,
-    create_tenant_details,
-    create_request,
+    build_observability_bundle,
     build_baggage_builder,
 )
 from constants import DEFAULT_AGENT_ID
 
-# Context variables for thread/async-safe observability context
-# These are used by MCP tool wrappers to access the current request's context
-# without risk of concurrent request interference
-_current_agent_details: contextvars.ContextVar = contextvars.ContextVar('agent_details', default=None)
-_current_tenant_details: contextvars.ContextVar = contextvars.ContextVar('tenant_details', default=None)
-
 
 class CrewAIAgent(AgentInterface):
     """CrewAI Agent wrapper suitable for GenericAgentHost."""
@@ -139,8 +133,6 @@ class CrewAIAgent(AgentInterface):
         return create_observable_mcp_tools(
             mcp_tools=self.mcp_tools,
             tool_executor=self.mcp_tool_executor,
-            get_agent_details=lambda: _current_agent_details.get(),
-            get_tenant_details=lambda: _current_tenant_details.get(),
         )
 
     # =========================================================================
@@ -173,17 +165,15 @@ class CrewAIAgent(AgentInterface):
 
             with build_baggage_builder(context, ctx_details.correlation_id).build():
                 # Create observability details
-                agent_details = create_agent_details(ctx_details, "AI agent powered by CrewAI framework")
-                caller_details = create_caller_details(ctx_details)
-                tenant_details = create_tenant_details(ctx_details)
-                request = create_request(ctx_details, message)
-                invoke_details = create_invoke_agent_details(ctx_details, "AI agent powered by CrewAI framework")
+                observability = build_observability_bundle(
+                    ctx_details, message, "AI agent powered by CrewAI framework"
+                )
 
                 with InvokeAgentScope.start(
-                    invoke_agent_details=invoke_details,
-                    tenant_details=tenant_details,
-                    request=request,
-                    caller_details=caller_details,
+                    invoke_agent_details=observability.invoke_agent_details,
+                    tenant_details=observability.tenant_details,
+                    request=observability.request,
+                    caller_details=observability.caller_details,
                 ) as invoke_scope:
                     if hasattr(invoke_scope, 'record_input_messages'):
                         invoke_scope.record_input_messages([message])
@@ -193,8 +183,8 @@ class CrewAIAgent(AgentInterface):
 
                     # Store context for observable MCP tool wrappers using context variables
                     # This is thread/async-safe for concurrent request handling
-                    agent_details_token = _current_agent_details.set(agent_details)
-                    tenant_details_token = _current_tenant_details.set(tenant_details)
+                    agent_details_token = current_agent_details.set(observability.agent_details)
+                    tenant_details_token = current_tenant_details.set(observability.tenant_details)
 
                     try:
                         # Create observable MCP tool wrappers
@@ -206,15 +196,20 @@ class CrewAIAgent(AgentInterface):
 
                         # Run CrewAI with InferenceScope
                         full_response = await self._run_crew_with_inference_scope(
-                            message, observable_mcp_tools, agent_details, tenant_details, request, display_name
+                            message,
+                            observable_mcp_tools,
+                            observability.agent_details,
+                            observability.tenant_details,
+                            observability.request,
+                            display_name,
                         )
 
                         if hasattr(invoke_scope, 'record_output_messages'):
                             invoke_scope.record_output_messages([full_response])
                     finally:
                         # Reset context variables to previous values
-                        _current_agent_details.reset(agent_details_token)
-                        _current_tenant_details.reset(tenant_details_token)
+                        current_agent_details.reset(agent_details_token)
+                        current_tenant_details.reset(tenant_details_token)
 
                 logger.info("✅ Observability scopes closed successfully")
                 return full_response
@@ -40,7 +40,6 @@ from microsoft_agents.hosting.core import (
 )
 from microsoft_agents_a365.observability.core.middleware.baggage_builder import BaggageBuilder
 from microsoft_agents_a365.observability.core import InvokeAgentScope
-from microsoft_agents_a365.observability.core.config import configure as configure_observability
 from microsoft_agents_a365.runtime.environment_utils import (
     get_observability_authentication_scope,
 )
@@ -55,13 +54,10 @@ from microsoft_agents_a365.notifications import EmailResponse, NotificationTypes
 
 from turn_context_utils import (
     extract_turn_context_details,
-    create_invoke_agent_details,
-    create_caller_details,
-    create_tenant_details,
-    create_request,
+    build_observability_bundle,
 )
-from token_cache import cache_agentic_token, get_cached_agentic_token
-from constants import DEFAULT_SERVICE_NAME, DEFAULT_SERVICE_NAMESPACE
+from token_cache import cache_agentic_token
+from observability_config import initialize_observability, is_observability_enabled
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -76,6 +72,9 @@ observability_logger.setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+# Pending-connection queue size for the listening socket (kernel default is 128)
+SERVER_BACKLOG = 2048
+
 # Load configuration
 load_dotenv()
 agents_sdk_config = load_configuration_from_env(environ)
@@ -262,10 +261,13 @@ class GenericAgentHost:
                     typing_task = asyncio.create_task(_typing_loop())
                     try:
                         # Create observability details using shared utility
-                        invoke_details = create_invoke_agent_details(ctx_details, "AI agent powered by CrewAI framework")
-                        caller_details = create_caller_details(ctx_details)
-                        tenant_details = create_tenant_details(ctx_details)
-                        request = create_request(ctx_details, user_message)
+                        observability = build_observability_bundle(
+                            ctx_details, user_message, "AI agent powered by CrewAI framework"
+                        )
+                        invoke_details = observability.invoke_agent_details
+                        caller_details = observability.caller_details
+                        tenant_details = observability.tenant_details
+                        request = observability.request
 
                         # Wrap the agent invocation with InvokeAgentScope
                         with InvokeAgentScope.start(
@@ -579,13 +581,32 @@ class GenericAgentHost:
         print("Ready for testing!\n")
 
         try:
-            run_app(app, host=host, port=port)
+            # run_app installs SIGINT/SIGTERM handling, so runner cleanup and the
+            # on_cleanup hooks still run when the container is stopped
+            run_app(
+                app,
+                host=host,
+                port=port,
+                backlog=SERVER_BACKLOG,
+                reuse_port=self._reuse_port_enabled(),
+            )
         except KeyboardInterrupt:
             print("\nServer stopped")
         except Exception as error:
             logger.error("Server error: %s", error)
             raise error
 
+    def _reuse_port_enabled(self) -> bool:
+        """
+        Check whether the listening socket should use SO_REUSEPORT.
+
+        Opt-in via SERVER_REUSE_PORT, since it also lets a stale process keep
+        silently sharing the port; ignored where the platform lacks SO_REUSEPORT.
+        """
+        if environ.get("SERVER_REUSE_PORT", "false").lower() not in ("true", "1", "yes"):
+            return False
+        return hasattr(socket, "SO_REUSEPORT")
+
     async def cleanup(self):
         """Clean up resources."""
         if self.agent_instance:
@@ -608,55 +629,14 @@ def create_and_run_host(agent_class: type[AgentInterface], *agent_args, **agent_
     if not check_agent_inheritance(agent_class):
         raise TypeError(f"Agent class {agent_class.__name__} must inherit from AgentInterface")
 
-    # Configure observability if not already configured (e.g., by start_with_generic_host.py)
+    # Configure observability unless already configured (e.g., by start_with_generic_host.py).
     # Note: Early configuration in start_with_generic_host.py is preferred to avoid
     # CrewAI's TracerProvider being set up before ours
-    enable_observability = os.getenv("ENABLE_OBSERVABILITY", "true").lower() in ("true", "1", "yes")
-    if enable_observability:
-        from opentelemetry import trace as otel_trace
-        existing_provider = otel_trace.get_tracer_provider()
-        provider_type = type(existing_provider).__name__
-        
-        # Check if observability was already configured with our service name
-        is_already_configured = False
-        if hasattr(existing_provider, 'resource'):
-            resource_attrs = dict(existing_provider.resource.attributes)
-            service_name = resource_attrs.get('service.name', '')
-            # If service name contains our identifier, skip reconfiguration
-            if DEFAULT_SERVICE_NAME.split('-')[0] in service_name.lower() or 'agent365' in service_name.lower():
-                is_already_configured = True
-                logger.info(f"✅ Observability already configured: {service_name}")
-        
-        if not is_already_configured:
-            service_name = os.getenv("OBSERVABILITY_SERVICE_NAME", DEFAULT_SERVICE_NAME)
-            service_namespace = os.getenv("OBSERVABILITY_SERVICE_NAMESPACE", DEFAULT_SERVICE_NAMESPACE)
-            
-            # Token resolver for observability exporter (must be sync)
-            def token_resolver(agent_id: str, tenant_id: str) -> str | None:
-                """Resolve authentication token for observability exporter"""
-                token = get_cached_agentic_token(tenant_id, agent_id)
-                if token:
-                    logger.debug(f"Token resolver: found cached token for {agent_id}:{tenant_id}")
-                else:
-                    logger.debug(f"Token resolver: no cached token for {agent_id}:{tenant_id}")
-                return token
-            
-            try:
-                logger.info(f"🔍 Existing TracerProvider: {provider_type}")
-                if hasattr(existing_provider, 'resource'):
-                    logger.info(f"🔍 Existing resource: {existing_provider.resource.attributes}")
-                
-                configure_observability(
-                    service_name=service_name,
-                    service_namespace=service_namespace,
-                    token_resolver=token_resolver,
-                    cluster_category=os.getenv("PYTHON_ENVIRONMENT", "development"),
-                )
-                print("✅ Observability configured")
-                logger.info(f"✅ Observability configured: {service_name} ({service_namespace})")
-            except Exception as e:
-                print(f"⚠️ Failed to configure observability: {e}")
-                logger.warning(f"⚠️ Failed to configure observability: {e}")
+    if is_observability_enabled():
+        if initialize_observability():
+            print("✅ Observability configured")
+        else:
+            print("⚠️ Failed to configure observability")
     else:
         print("ℹ️ Observability disabled (ENABLE_OBSERVABILITY=false)")
         logger.info("ℹ️ Observability disabled (ENABLE_OBSERVABILITY=false)")
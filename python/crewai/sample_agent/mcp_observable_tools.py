@@ -9,10 +9,13 @@ This module separates the MCP tool wrapper logic from the main agent for better
 """
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import uuid
-from typing import TYPE_CHECKING, Any, Type
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Type
 from urllib.parse import urlparse
 
 from crewai.tools import BaseTool
@@ -26,6 +29,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Context variables for thread/async-safe observability context.
+# The agent sets these for the duration of a request; MCP tool wrappers read them
+# on every invocation without risk of concurrent request interference.
+current_agent_details: ContextVar[Any] = ContextVar("agent_details", default=None)
+current_tenant_details: ContextVar[Any] = ContextVar("tenant_details", default=None)
+
+# Longest a CrewAI worker thread waits for a tool call handed to the agent's event loop
+MCP_TOOL_CALL_TIMEOUT_SECONDS = 300
+
 
 class MCPToolExecutor:
     """
@@ -43,6 +55,45 @@ class MCPToolExecutor:
             mcp_service: The MCP tool registration service for executing tools
         """
         self.mcp_service = mcp_service
+        # The agent's long-lived event loop; tool calls from CrewAI's worker
+        # threads run on it so the MCP service's pooled HTTP session is reused
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_to_running_loop(self) -> None:
+        """Record the running event loop as the one tool calls are executed on."""
+        self._loop = asyncio.get_running_loop()
+
+    def run_sync(self, coro) -> str:
+        """
+        Run a tool call coroutine from a synchronous (CrewAI worker thread) context.
+        
+        The call is handed to the bound agent loop when it is running in another
+        thread. Without one, it runs on a private loop whose pooled HTTP session
+        is closed before that loop ends.
+        
+        Args:
+            coro: The call_tool coroutine to run
+            
+        Returns:
+            The tool result as a string
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(coro, loop)
+                return future.result(timeout=MCP_TOOL_CALL_TIMEOUT_SECONDS)
+
+        async def run_and_close_session() -> str:
+            try:
+                return await coro
+            finally:
+                await self.mcp_service.close_loop_session()
+
+        return asyncio.run(run_and_close_session())
 
     async def call_tool(
         self,
@@ -111,8 +162,6 @@ class MCPToolExecutor:
 def create_observable_mcp_tools(
     mcp_tools: list[MCPToolDefinition],
     tool_executor: MCPToolExecutor,
-    get_agent_details: callable,
-    get_tenant_details: callable,
 ) -> list[BaseTool]:
     """
     Create CrewAI-compatible tool wrappers for MCP tools with ExecuteToolScope observability.
@@ -120,29 +169,24 @@ def create_observable_mcp_tools(
     Instead of using CrewAI's native `mcps` parameter (which handles tool execution internally
     without observability hooks), this function creates custom CrewAI tools that wrap MCP calls
     with ExecuteToolScope for proper tracing.
+
+    Agent and tenant details are read from the `current_agent_details` and
+    `current_tenant_details` context variables at call time.
     
     Args:
         mcp_tools: List of MCP tool definitions from the registration service
         tool_executor: MCPToolExecutor instance for executing tools with observability
-        get_agent_details: Callable that returns current agent details for observability
-        get_tenant_details: Callable that returns current tenant details for observability
     
     Returns:
         List of CrewAI BaseTool instances that wrap MCP tools with observability
     """
     observable_tools = []
+    # Created on the agent's event loop; tool calls are sent back to it from CrewAI's threads
+    tool_executor.bind_to_running_loop()
     
     for mcp_tool in mcp_tools:
-        # Create dynamic input schema from MCP tool's input schema
-        input_fields = _build_input_fields(mcp_tool)
-        
-        # Create dynamic Pydantic model for input schema
-        InputModel = create_model(f"{mcp_tool.name}Input", **input_fields)
-        
-        # Create a closure to capture the tool definition and executor reference
-        tool_class = _create_tool_class(
-            mcp_tool, InputModel, tool_executor, get_agent_details, get_tenant_details
-        )
+        # Typed args schema built from the MCP input schema (cached per distinct schema)
+        tool_class = _create_tool_class(mcp_tool, tool_executor)
         
         observable_tools.append(tool_class)
         logger.info(f"📊 Created observable wrapper for MCP tool: {mcp_tool.name}")
@@ -150,34 +194,36 @@ def create_observable_mcp_tools(
     return observable_tools
 
 
-def _build_input_fields(mcp_tool: MCPToolDefinition) -> dict:
+@lru_cache(maxsize=256)
+def _get_args_model(tool_name: str, schema_key: str) -> Type[BaseModel]:
     """
-    Build Pydantic field definitions from MCP tool input schema.
+    Build (once per tool name and input schema) the Pydantic args model CrewAI
+    exposes to the LLM, so every typed MCP parameter appears in the function schema.
     
     Args:
-        mcp_tool: The MCP tool definition
+        tool_name: The MCP tool name, used to name the model
+        schema_key: The MCP tool input schema serialized with sorted keys
         
     Returns:
-        Dictionary of field name to (type, Field) tuples for Pydantic model creation
+        Pydantic model with one field per declared argument
     """
+    input_schema = json.loads(schema_key)
     input_fields = {}
-    
-    if mcp_tool.input_schema and "properties" in mcp_tool.input_schema:
-        for prop_name, prop_def in mcp_tool.input_schema.get("properties", {}).items():
-            field_type = _get_python_type(prop_def.get("type"))
-            description = prop_def.get("description", f"Parameter {prop_name}")
-            required = prop_name in mcp_tool.input_schema.get("required", [])
-            
-            if required:
-                input_fields[prop_name] = (field_type, Field(..., description=description))
-            else:
-                input_fields[prop_name] = (field_type, Field(default=None, description=description))
-    
+
+    required = set(input_schema.get("required", []))
+    for prop_name, prop_def in (input_schema.get("properties") or {}).items():
+        field_type = _get_python_type(prop_def.get("type"))
+        description = prop_def.get("description", f"Parameter {prop_name}")
+        if prop_name in required:
+            input_fields[prop_name] = (field_type, Field(..., description=description))
+        else:
+            input_fields[prop_name] = (Optional[field_type], Field(default=None, description=description))
+
     # If no input schema, create a generic one
     if not input_fields:
         input_fields["input"] = (str, Field(default="", description="Input for the tool"))
-    
-    return input_fields
+
+    return create_model(f"{tool_name}Input", **input_fields)
 
 
 def _get_python_type(json_type: str | None) -> type:
@@ -202,20 +248,14 @@ def _get_python_type(json_type: str | None) -> type:
 
 def _create_tool_class(
     tool_def: MCPToolDefinition,
-    input_model: Type[BaseModel],
     tool_executor: MCPToolExecutor,
-    get_agent_details: callable,
-    get_tenant_details: callable,
 ) -> BaseTool:
     """
     Create a CrewAI BaseTool class for an MCP tool with observability.
     
     Args:
         tool_def: The MCP tool definition
-        input_model: Pydantic model for input validation
         tool_executor: MCPToolExecutor for executing the tool
-        get_agent_details: Callable to get current agent details
-        get_tenant_details: Callable to get current tenant details
         
     Returns:
         Instance of the created tool class
@@ -223,42 +263,30 @@ def _create_tool_class(
     class ObservableMCPTool(BaseTool):
         name: str = tool_def.name
         description: str = tool_def.description or f"MCP tool: {tool_def.name}"
-        args_schema: Type[BaseModel] = input_model
+        args_schema: Type[BaseModel] = _get_args_model(
+            tool_def.name, json.dumps(tool_def.input_schema or {}, sort_keys=True)
+        )
+
+        # Bound once at class creation so each call reads class attributes
+        # instead of dereferencing the enclosing closure
+        _tool_name: ClassVar[str] = tool_def.name
+        _executor: ClassVar[MCPToolExecutor] = tool_executor
         
         def _run(self, **kwargs) -> str:
             """Execute MCP tool with ExecuteToolScope observability."""
-            # Run async call_tool in sync context
-            # Handle both cases: running inside an existing event loop or not
+            # Run async call_tool from CrewAI's synchronous tool execution
             try:
-                # Check if there's already a running event loop (e.g., from CrewAI)
-                loop = asyncio.get_running_loop()
-                # We're inside an async context - use run_coroutine_threadsafe
-                # This shouldn't normally happen with CrewAI's sync tool execution
-                import concurrent.futures
-                future = asyncio.run_coroutine_threadsafe(
-                    tool_executor.call_tool(
-                        tool_name=tool_def.name,
-                        arguments=kwargs,
-                        agent_details=get_agent_details(),
-                        tenant_details=get_tenant_details(),
-                    ),
-                    loop
-                )
-                result = future.result(timeout=300)  # 5 minute timeout
-                return result
-            except RuntimeError:
-                # No running event loop - use asyncio.run() for clean lifecycle management
-                result = asyncio.run(
-                    tool_executor.call_tool(
-                        tool_name=tool_def.name,
+                # Context variables are read here, in the caller's context, and passed explicitly
+                return self._executor.run_sync(
+                    self._executor.call_tool(
+                        tool_name=self._tool_name,
                         arguments=kwargs,
-                        agent_details=get_agent_details(),
-                        tenant_details=get_tenant_details(),
+                        agent_details=current_agent_details.get(),
+                        tenant_details=current_tenant_details.get(),
                     )
                 )
-                return result
             except Exception as e:
-                logger.error(f"❌ MCP tool '{tool_def.name}' error: {e}")
-                return f"Error executing {tool_def.name}: {str(e)}"
+                logger.error(f"❌ MCP tool '{self._tool_name}' error: {e}")
+                return f"Error executing {self._tool_name}: {str(e)}"
     
     return ObservableMCPTool()
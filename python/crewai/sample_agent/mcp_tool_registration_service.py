@@ -14,16 +14,27 @@ Features:
 - Executes MCP tool calls and returns results
 - Handles authentication and authorization
 - Converts tools to CrewAI-compatible format
+- Caches discovered tool catalogs (in memory and on disk) to skip tools/list round-trips
+- Briefly memoizes results of read-only tools called again with the same arguments
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+import hashlib
+import itertools
 import logging
 import os
 import random
+import time
+import traceback
+import weakref
 import aiohttp
 import asyncio
-import json
+import orjson
 
 from microsoft_agents.hosting.core import Authorization, TurnContext
 from microsoft_agents_a365.tooling.utils.constants import Constants
@@ -42,6 +53,46 @@ MCP_REQUEST_TIMEOUT_SECONDS = 30
 MCP_CONNECT_TIMEOUT_SECONDS = 10
 MCP_MAX_RETRIES = 2
 MCP_RETRY_BASE_DELAY_SECONDS = 1  # Base delay for exponential backoff
+MCP_MAX_RETRY_DELAY_SECONDS = 10  # Cap on a single backoff delay
+MCP_MAX_CONCURRENT_CONNECTIONS = 8  # Servers connected in parallel during discovery
+
+# Discovery connect timeouts by priority rank: (servers in tier, connect timeout seconds).
+# Servers past the last tier use MCP_DISCOVERY_CONNECT_TIMEOUT_SECONDS.
+MCP_DISCOVERY_CONNECT_TIMEOUT_TIERS = ((5, 2.0), (5, 3.0))
+MCP_DISCOVERY_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# HTTP connection pool defaults (override via MCP_HTTP_* env vars)
+DEFAULT_MCP_HTTP_MAX_CONNECTIONS = 200
+DEFAULT_MCP_HTTP_MAX_CONNECTIONS_PER_HOST = 100
+DEFAULT_MCP_HTTP_KEEPALIVE_SECONDS = 30
+MCP_READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# MCP session pooling (Streamable HTTP session header and idle eviction)
+MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
+MCP_ACCEPT_HEADER = "text/event-stream, application/json"
+MCP_SESSION_IDLE_TIMEOUT_SECONDS = 300
+
+# Tool calls to the same server within this window are sent as one JSON-RPC batch
+# (off by default: every call would otherwise wait for the window)
+DEFAULT_MCP_BATCH_WINDOW_MS = 0
+
+# Results of tools annotated readOnlyHint, reused for identical calls by the same caller
+DEFAULT_MCP_READ_ONLY_CACHE_TTL_SECONDS = 30
+MCP_READ_ONLY_CACHE_MAX_ENTRIES = 256
+
+# Circuit breaker: open after N consecutive failures, probe again after the cooldown
+MCP_BREAKER_FAILURE_THRESHOLD = 2
+MCP_BREAKER_COOLDOWN_SECONDS = 30
+
+# Server prioritization during discovery
+MCP_LATENCY_EWMA_ALPHA = 0.3  # Weight of the newest tools/list latency sample
+DEFAULT_MCP_MIN_TOOLS_THRESHOLD = 0  # Tools needed before discovery may exit early (0 waits for all)
+DEFAULT_MCP_DISCOVERY_SOFT_DEADLINE_SECONDS = 5
+DEFAULT_MCP_DISCOVERY_DEADLINE_SECONDS = 0  # 0 disables the hard discovery deadline
+
+# Tool catalog cache (override TTL via MCP_TOOLS_CACHE_TTL, 0 disables caching)
+DEFAULT_MCP_TOOLS_CACHE_TTL_SECONDS = 3600
+MCP_TOOLS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "a365", "mcp_tools.json")
 
 
 def get_mcp_platform_endpoint() -> str:
@@ -50,7 +101,48 @@ def get_mcp_platform_endpoint() -> str:
     return endpoint if endpoint else DEFAULT_MCP_PLATFORM_ENDPOINT
 
 
-@dataclass
+def _get_int_env(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to the default."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _is_jsonrpc_reply(message: Any) -> bool:
+    """Check that a tools/call response is a JSON-RPC result or error object."""
+    return isinstance(message, dict) and (
+        "error" in message or isinstance(message.get("result", {}), dict)
+    )
+
+
+def get_discovery_connect_timeout(rank: int) -> float:
+    """
+    Get the connect timeout for a server by its rank in discovery priority order.
+    
+    Args:
+        rank: Zero-based position of the server in the priority-sorted list.
+        
+    Returns:
+        Connect timeout in seconds.
+    """
+    tier_end = 0
+    for tier_size, timeout in MCP_DISCOVERY_CONNECT_TIMEOUT_TIERS:
+        tier_end += tier_size
+        if rank < tier_end:
+            return timeout
+    return MCP_DISCOVERY_CONNECT_TIMEOUT_SECONDS
+
+
+def get_mcp_tools_cache_ttl() -> float:
+    """Get the tool catalog cache TTL in seconds from environment or use default."""
+    try:
+        return float(os.getenv("MCP_TOOLS_CACHE_TTL", DEFAULT_MCP_TOOLS_CACHE_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_MCP_TOOLS_CACHE_TTL_SECONDS
+
+
+@dataclass(slots=True)
 class MCPToolDefinition:
     """Definition of an MCP tool"""
     name: str
@@ -58,9 +150,10 @@ class MCPToolDefinition:
     input_schema: Dict[str, Any]
     server_url: str
     server_name: str
+    read_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServerConnection:
     """Information about a connected MCP server"""
     name: str
@@ -68,6 +161,46 @@ class MCPServerConnection:
     headers: Dict[str, str] = field(default_factory=dict)
     tools: List[MCPToolDefinition] = field(default_factory=list)
     connected: bool = False
+    # Full request headers (including the SSE Accept header), built once
+    request_headers: Dict[str, str] = field(init=False)
+
+    def __post_init__(self):
+        self.request_headers = {**self.headers, "Accept": MCP_ACCEPT_HEADER}
+
+
+class BreakerStatus(str, Enum):
+    """Circuit breaker states for an MCP server"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerState:
+    """Circuit breaker bookkeeping for one MCP server URL"""
+    status: BreakerStatus = BreakerStatus.CLOSED
+    failure_count: int = 0
+    opened_at: float = 0.0
+    probe_started_at: Optional[float] = None  # Set while the single half-open probe is in flight
+
+
+@dataclass
+class ServerStats:
+    """Connection history for one MCP server URL, used to order discovery"""
+    ewma_latency: float = 0.0
+    fail_count: int = 0
+    last_success: Optional[float] = None
+    cache_hits: int = 0  # Connects served from the cached tool catalog (no latency sample)
+
+
+@dataclass
+class PooledSession:
+    """MCP session state reused across tool calls for one server and caller identity"""
+    url: str
+    identity_key: str
+    session_id: Optional[str] = None
+    last_used: float = field(default_factory=time.monotonic)
+    use_count: int = 0
 
 
 class McpToolRegistrationService:
@@ -92,12 +225,382 @@ class McpToolRegistrationService:
             logger: Logger instance for logging operations.
         """
         self._logger = logger or logging.getLogger(self.__class__.__name__)
-        self._connected_servers: List[MCPServerConnection] = []
+        self._connected_servers: Dict[str, MCPServerConnection] = {}
+        self._crewai_server_cache: Optional[List[Dict[str, Any]]] = None
+        self._servers_by_url: Dict[str, MCPServerConnection] = {}
         self._tools_by_name: Dict[str, MCPToolDefinition] = {}
         self._auth_token: Optional[str] = None
         self._config_service = McpToolServerConfigurationService(logger=self._logger)
 
-    def _load_manifest_servers_fallback(self) -> List[Dict[str, Any]]:
+        # JSON-RPC request ids, unique across concurrent requests
+        self._request_ids = itertools.count(1)
+
+        # Pooled HTTP sessions, one per event loop (aiohttp sessions are bound to
+        # the loop they were created on). Tool calls normally run on the agent's
+        # loop; a session made on a private loop is closed before that loop ends.
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # MCP sessions keyed by (server URL, caller identity hash)
+        self._session_pool: Dict[Tuple[str, str], PooledSession] = {}
+
+        # Circuit breakers keyed by server URL
+        self._breakers: Dict[str, BreakerState] = {}
+
+        # Latency and failure history keyed by server URL (kept across cleanup)
+        self._server_stats: Dict[str, ServerStats] = {}
+
+        # Tool calls waiting to be batched, per event loop and server URL
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, List[Tuple[asyncio.Future, Dict[str, Any]]]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._batch_unsupported: Set[str] = set()
+
+        # Read-only tool results: (identity hash, tool name, arguments) -> (timestamp, result)
+        self._read_only_results: "OrderedDict[Tuple[str, str, bytes], Tuple[float, str]]" = OrderedDict()
+
+        # Tool catalog cache: key -> (timestamp, {server_url: tools})
+        self._tool_catalog_cache: Dict[str, Tuple[float, Dict[str, List[MCPToolDefinition]]]] = {}
+        self._tool_catalog_manifest_mtime: Optional[float] = None
+        self._tool_catalog_loaded = False
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session for the running event loop, creating it on first use.
+        
+        The session keeps connections alive so TCP and TLS setup is amortized
+        across tool listing and tool calls.
+        
+        Returns:
+            Shared aiohttp ClientSession.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                # Large tool results arrive as a single SSE data line; raise the
+                # read buffer so they don't exceed aiohttp's line-length limit
+                read_bufsize=MCP_READ_BUFFER_SIZE,
+                timeout=aiohttp.ClientTimeout(
+                    total=MCP_REQUEST_TIMEOUT_SECONDS,
+                    connect=MCP_CONNECT_TIMEOUT_SECONDS,
+                ),
+                connector=aiohttp.TCPConnector(
+                    limit=_get_int_env("MCP_HTTP_MAX_CONNECTIONS", DEFAULT_MCP_HTTP_MAX_CONNECTIONS),
+                    limit_per_host=_get_int_env(
+                        "MCP_HTTP_MAX_CONNECTIONS_PER_HOST", DEFAULT_MCP_HTTP_MAX_CONNECTIONS_PER_HOST
+                    ),
+                    keepalive_timeout=_get_int_env(
+                        "MCP_HTTP_KEEPALIVE_SECONDS", DEFAULT_MCP_HTTP_KEEPALIVE_SECONDS
+                    ),
+                    ttl_dns_cache=300,
+                ),
+            )
+            self._sessions[loop] = session
+        return session
+
+    def _identity_key(self, headers: Dict[str, str]) -> str:
+        """Hash the Authorization header so per-caller state never holds the raw token."""
+        authorization = headers.get(Constants.Headers.AUTHORIZATION, "")
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
+    @asynccontextmanager
+    async def _acquire_session(
+        self, url: str, headers: Dict[str, str]
+    ) -> AsyncIterator[PooledSession]:
+        """
+        Acquire the pooled MCP session for a server and caller identity.
+        
+        Back-to-back calls with the same identity reuse the server-assigned
+        Mcp-Session-Id. Sessions idle for longer than MCP_SESSION_IDLE_TIMEOUT_SECONDS
+        are evicted on acquire.
+        
+        Args:
+            url: MCP server URL.
+            headers: Request headers; the Authorization header identifies the caller.
+            
+        Yields:
+            The PooledSession for this server and identity.
+        """
+        now = time.monotonic()
+        for key, idle in list(self._session_pool.items()):
+            if now - idle.last_used > MCP_SESSION_IDLE_TIMEOUT_SECONDS:
+                del self._session_pool[key]
+
+        identity_key = self._identity_key(headers)
+        pooled = self._session_pool.get((url, identity_key))
+        if pooled is None:
+            pooled = PooledSession(url=url, identity_key=identity_key)
+            self._session_pool[(url, identity_key)] = pooled
+
+        pooled.use_count += 1
+        try:
+            yield pooled
+        finally:
+            pooled.last_used = time.monotonic()
+
+    def _breaker_allows(self, url: str) -> bool:
+        """
+        Check whether a request to a server may proceed.
+        
+        An open breaker rejects requests until the cooldown elapses, then moves to
+        half-open and lets a single probe request through. Other requests are
+        rejected until the probe records a success or failure; a probe that never
+        reports back is replaced after another cooldown.
+        
+        Args:
+            url: MCP server URL.
+            
+        Returns:
+            True if the request may be sent, False if the server is short-circuited.
+        """
+        breaker = self._breakers.get(url)
+        if breaker is None or breaker.status == BreakerStatus.CLOSED:
+            return True
+        now = time.monotonic()
+        if breaker.status == BreakerStatus.OPEN:
+            if now - breaker.opened_at < MCP_BREAKER_COOLDOWN_SECONDS:
+                return False
+            breaker.status = BreakerStatus.HALF_OPEN
+            breaker.probe_started_at = None
+        if (
+            breaker.probe_started_at is not None
+            and now - breaker.probe_started_at < MCP_BREAKER_COOLDOWN_SECONDS
+        ):
+            return False
+        breaker.probe_started_at = now
+        return True
+
+    def _record_success(self, url: str) -> None:
+        """Close the breaker for a server after a successful request."""
+        breaker = self._breakers.get(url)
+        if breaker is not None:
+            breaker.status = BreakerStatus.CLOSED
+            breaker.failure_count = 0
+            breaker.probe_started_at = None
+
+    def _record_failure(self, url: str) -> None:
+        """Count a failed request and open the breaker once the threshold is reached."""
+        breaker = self._breakers.setdefault(url, BreakerState())
+        breaker.failure_count += 1
+        breaker.probe_started_at = None
+        if (
+            breaker.status == BreakerStatus.HALF_OPEN
+            or breaker.failure_count >= MCP_BREAKER_FAILURE_THRESHOLD
+        ):
+            if breaker.status != BreakerStatus.OPEN:
+                self._logger.warning(
+                    f"⚡ Circuit opened for MCP server {url} after {breaker.failure_count} failure(s)"
+                )
+            breaker.status = BreakerStatus.OPEN
+            breaker.opened_at = time.monotonic()
+
+    def _record_server_stats(self, url: str, latency: Optional[float]) -> None:
+        """
+        Update the connection history for a server.
+        
+        Args:
+            url: MCP server URL.
+            latency: tools/list latency in seconds, or None if the connection failed.
+        """
+        stats = self._server_stats.setdefault(url, ServerStats())
+        if latency is None:
+            stats.fail_count += 1
+            return
+        if stats.last_success is None:
+            stats.ewma_latency = latency
+        else:
+            stats.ewma_latency += MCP_LATENCY_EWMA_ALPHA * (latency - stats.ewma_latency)
+        stats.fail_count = 0
+        stats.last_success = time.monotonic()
+
+    def _server_priority(self, url: str) -> Tuple[bool, int, float]:
+        """
+        Get the sort key that orders servers for discovery.
+        
+        Servers with a closed breaker come first, then those with fewer recent
+        failures, then the fastest by weighted-average response time. Servers
+        with no history sort ahead of known-slow ones.
+        
+        Args:
+            url: MCP server URL.
+            
+        Returns:
+            Sort key; lower sorts first.
+        """
+        breaker = self._breakers.get(url)
+        stats = self._server_stats.get(url) or ServerStats()
+        breaker_open = breaker is not None and breaker.status == BreakerStatus.OPEN
+        return (breaker_open, stats.fail_count, stats.ewma_latency)
+
+    def get_server_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the latency and failure history recorded for each server.
+        
+        Returns:
+            Mapping of server URL to its stats.
+        """
+        return {url: asdict(stats) for url, stats in self._server_stats.items()}
+
+    def get_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker state for every server that has recorded a failure.
+        
+        Returns:
+            Mapping of server URL to its breaker status and failure count.
+        """
+        return {
+            url: {"status": breaker.status.value, "failure_count": breaker.failure_count}
+            for url, breaker in self._breakers.items()
+        }
+
+    def _get_manifest_path(self) -> str:
+        """Get the path of the local ToolingManifest.json."""
+        return os.path.join(os.getcwd(), "ToolingManifest.json")
+
+    def _get_manifest_mtime(self) -> Optional[float]:
+        """Get the modification time of ToolingManifest.json, or None if it does not exist."""
+        try:
+            return os.path.getmtime(self._get_manifest_path())
+        except OSError:
+            return None
+
+    def _tool_catalog_key(
+        self,
+        agentic_app_id: str,
+        server_configs: List[Dict[str, Any]],
+        context: TurnContext,
+    ) -> str:
+        """
+        Build the tool catalog cache key.
+        
+        The key covers the agent, its tenant and agentic user, and the set of server
+        URLs. It deliberately leaves out the token, which rotates about hourly and
+        would otherwise leave a new entry behind on every rotation.
+        """
+        recipient = context.activity.recipient if context and context.activity else None
+        tenant_id = getattr(recipient, "tenant_id", None) or ""
+        agentic_user_id = getattr(recipient, "agentic_user_id", None) or ""
+        urls = sorted(config["url"] for config in server_configs)
+        raw_key = "|".join([agentic_app_id or "", tenant_id, agentic_user_id, *urls])
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def _load_tool_catalog_cache(self) -> None:
+        """Load the persisted tool catalog cache from disk (once per service instance)."""
+        if self._tool_catalog_loaded:
+            return
+        self._tool_catalog_loaded = True
+
+        try:
+            with open(MCP_TOOLS_CACHE_PATH, 'rb') as f:
+                data = orjson.loads(f.read())
+
+            self._tool_catalog_manifest_mtime = data.get("manifest_mtime")
+            for key, entry in data.get("entries", {}).items():
+                servers = {
+                    url: [MCPToolDefinition(**tool) for tool in tools]
+                    for url, tools in entry.get("servers", {}).items()
+                }
+                self._tool_catalog_cache[key] = (entry.get("timestamp", 0.0), servers)
+
+            self._logger.debug(f"Loaded {len(self._tool_catalog_cache)} cached tool catalog(s)")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self._logger.warning(f"⚠️ Ignoring unreadable tool catalog cache: {e}")
+
+    def _save_tool_catalog_cache(self) -> None:
+        """Persist the tool catalog cache to disk, dropping expired entries first."""
+        cutoff = time.time() - get_mcp_tools_cache_ttl()
+        for key in [key for key, (timestamp, _) in self._tool_catalog_cache.items() if timestamp <= cutoff]:
+            del self._tool_catalog_cache[key]
+
+        data = {
+            "manifest_mtime": self._tool_catalog_manifest_mtime,
+            "entries": {
+                key: {
+                    "timestamp": timestamp,
+                    "servers": {
+                        url: [asdict(tool) for tool in tools]
+                        for url, tools in servers.items()
+                    },
+                }
+                for key, (timestamp, servers) in self._tool_catalog_cache.items()
+            },
+        }
+
+        try:
+            os.makedirs(os.path.dirname(MCP_TOOLS_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{MCP_TOOLS_CACHE_PATH}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, MCP_TOOLS_CACHE_PATH)
+        except OSError as e:
+            self._logger.warning(f"⚠️ Failed to persist tool catalog cache: {e}")
+
+    def _get_cached_tool_catalog(self, key: str) -> Optional[Dict[str, List[MCPToolDefinition]]]:
+        """
+        Get a fresh cached tool catalog.
+        
+        Args:
+            key: Tool catalog cache key.
+            
+        Returns:
+            Mapping of server URL to tools, or None if missing, expired or invalidated.
+        """
+        ttl = get_mcp_tools_cache_ttl()
+        if ttl <= 0:
+            return None
+
+        self._load_tool_catalog_cache()
+
+        # Editing ToolingManifest.json invalidates every cached catalog
+        manifest_mtime = self._get_manifest_mtime()
+        if manifest_mtime != self._tool_catalog_manifest_mtime:
+            self._tool_catalog_cache.clear()
+            self._tool_catalog_manifest_mtime = manifest_mtime
+            return None
+
+        entry = self._tool_catalog_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, servers = entry
+        if time.time() - timestamp >= ttl:
+            del self._tool_catalog_cache[key]
+            return None
+
+        return servers
+
+    def _store_tool_catalog(self, key: str, servers: Dict[str, List[MCPToolDefinition]]) -> None:
+        """
+        Store a tool catalog in the in-memory cache and persist it.
+        
+        Args:
+            key: Tool catalog cache key.
+            servers: Mapping of server URL to its tools.
+        """
+        if get_mcp_tools_cache_ttl() <= 0:
+            return
+
+        self._tool_catalog_cache[key] = (time.time(), servers)
+        self._save_tool_catalog_cache()
+
+    def invalidate_tools_cache(self) -> None:
+        """Drop all cached tool catalogs, in memory and on disk."""
+        self._tool_catalog_cache.clear()
+        self._tool_catalog_loaded = True
+        try:
+            os.remove(MCP_TOOLS_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self._logger.warning(f"⚠️ Failed to remove tool catalog cache: {e}")
+        self._logger.info("MCP tool catalog cache invalidated")
+
+    async def _load_manifest_servers_fallback(self) -> List[Dict[str, Any]]:
         """
         Load MCP server configurations directly from ToolingManifest.json.
         
@@ -108,15 +611,11 @@ class McpToolRegistrationService:
             List of server configurations with name, url, scope, audience.
         """
         servers = []
-        manifest_path = os.path.join(os.getcwd(), "ToolingManifest.json")
-        
-        if not os.path.exists(manifest_path):
-            self._logger.debug(f"ToolingManifest.json not found at {manifest_path}")
-            return servers
+        manifest_path = self._get_manifest_path()
         
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            # Read in a worker thread so concurrent MCP work isn't blocked on disk I/O
+            manifest = orjson.loads(await asyncio.to_thread(Path(manifest_path).read_bytes))
             
             self._logger.info(f"📄 [Fallback] Loaded ToolingManifest.json")
             
@@ -135,6 +634,8 @@ class McpToolRegistrationService:
                     })
                     self._logger.info(f"  📌 [Manifest] Server: {name} -> {url}")
             
+        except FileNotFoundError:
+            self._logger.debug(f"ToolingManifest.json not found at {manifest_path}")
         except Exception as e:
             self._logger.error(f"Failed to load ToolingManifest.json: {e}")
         
@@ -273,57 +774,152 @@ class McpToolRegistrationService:
         # Fallback to ToolingManifest.json if SDK returned no servers (development mode)
         if not mcp_server_configs:
             self._logger.info("📄 Falling back to ToolingManifest.json for server discovery")
-            mcp_server_configs = self._load_manifest_servers_fallback()
+            mcp_server_configs = await self._load_manifest_servers_fallback()
         
         self._logger.info(f"Found {len(mcp_server_configs)} MCP server configurations total")
         
-        # Connect to each server and fetch tools
-        all_tools: List[MCPToolDefinition] = []
+        # Reuse a fresh cached tool catalog to skip tools/list round-trips
+        catalog_key = self._tool_catalog_key(agentic_app_id, mcp_server_configs, context)
+        cached_catalog = self._get_cached_tool_catalog(catalog_key) or {}
+        if cached_catalog:
+            self._logger.info(f"📦 Using cached tool catalog for {len(cached_catalog)} MCP server(s)")
         
-        for server_config in mcp_server_configs:
-            try:
-                connection = await self._connect_to_server(
+        # Most reliable and fastest servers first, so they take the semaphore slots
+        mcp_server_configs.sort(key=lambda config: self._server_priority(config["url"]))
+        
+        # Connect to all servers concurrently (bounded) so discovery takes the
+        # time of the slowest server rather than the sum of all of them
+        semaphore = asyncio.Semaphore(MCP_MAX_CONCURRENT_CONNECTIONS)
+
+        async def connect(server_config: Dict[str, Any], rank: int) -> Optional[MCPServerConnection]:
+            async with semaphore:
+                return await self._connect_to_server(
                     name=server_config["name"],
                     url=server_config["url"],
                     auth_token=auth_token,
+                    tools=cached_catalog.get(server_config["url"]),
+                    connect_timeout=get_discovery_connect_timeout(rank),
                 )
-                
-                if connection and connection.connected:
-                    self._connected_servers.append(connection)
-                    all_tools.extend(connection.tools)
-                    
-                    # Index tools by name for quick lookup
-                    for tool in connection.tools:
-                        self._tools_by_name[tool.name] = tool
-                    
-                    self._logger.info(
-                        f"Connected to MCP server '{connection.name}' with "
-                        f"{len(connection.tools)} tools"
-                    )
-                    
-            except (TimeoutError, ConnectionError, OSError) as e:
-                # Recoverable network errors - continue to next server
-                self._logger.warning(
-                    f"Failed to connect to MCP server {server_config['name']}: {e}"
-                )
-                continue
-            except Exception as e:
-                # Non-recoverable or unexpected errors - log full stack trace
-                import traceback
-                self._logger.error(
-                    f"Unexpected error connecting to MCP server {server_config['name']}: {e}\n"
-                    f"{traceback.format_exc()}"
+
+        tasks = {
+            asyncio.create_task(connect(server_config, rank)): server_config
+            for rank, server_config in enumerate(mcp_server_configs)
+        }
+        
+        # Once enough tools are available, stop waiting for stragglers after the
+        # soft deadline instead of blocking on the slowest server
+        min_tools = _get_int_env("MCP_MIN_TOOLS_THRESHOLD", DEFAULT_MCP_MIN_TOOLS_THRESHOLD)
+        soft_deadline = _get_int_env(
+            "MCP_DISCOVERY_SOFT_DEADLINE_SECONDS", DEFAULT_MCP_DISCOVERY_SOFT_DEADLINE_SECONDS
+        )
+        # Hard cap on the whole discovery, regardless of how many tools are available
+        deadline = _get_int_env("MCP_DISCOVERY_DEADLINE", DEFAULT_MCP_DISCOVERY_DEADLINE_SECONDS)
+        started = time.monotonic()
+        
+        all_tools: List[MCPToolDefinition] = []
+        catalog: Dict[str, List[MCPToolDefinition]] = {}
+        catalog_changed = False
+        
+        pending = set(tasks)
+        while pending:
+            elapsed = time.monotonic() - started
+            wait_timeout = None
+            if deadline > 0:
+                wait_timeout = deadline - elapsed
+            if min_tools > 0 and len(all_tools) >= min_tools:
+                soft_remaining = soft_deadline - elapsed
+                wait_timeout = soft_remaining if wait_timeout is None else min(wait_timeout, soft_remaining)
+            if wait_timeout is not None and wait_timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                server_config = tasks[task]
+                result = task.exception() or task.result()
+                self._process_connect_result(server_config, result, all_tools, catalog)
+                catalog_changed = catalog_changed or (
+                    server_config["url"] in catalog and server_config["url"] not in cached_catalog
                 )
-                continue
+        
+        if pending:
+            skipped = [tasks[task]["name"] for task in pending]
+            self._logger.warning(
+                f"⏩ {len(all_tools)} MCP tools available, not waiting for {len(skipped)} slow server(s): {skipped}"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            # Keep cached tools for skipped servers so the next discovery can use them
+            for task in pending:
+                url = tasks[task]["url"]
+                if url in cached_catalog:
+                    catalog[url] = cached_catalog[url]
+        
+        if catalog_changed:
+            self._store_tool_catalog(catalog_key, catalog)
         
         self._logger.info(f"Total {len(all_tools)} MCP tools available")
         return all_tools
 
+    def _process_connect_result(
+        self,
+        server_config: Dict[str, Any],
+        result: Any,
+        all_tools: List[MCPToolDefinition],
+        catalog: Dict[str, List[MCPToolDefinition]],
+    ) -> None:
+        """
+        Register the outcome of connecting to one server during discovery.
+        
+        Args:
+            server_config: The server's name and URL.
+            result: The MCPServerConnection, None, or the raised exception.
+            all_tools: Tools collected so far; extended in place.
+            catalog: Tool catalog being built; updated in place.
+        """
+        if isinstance(result, (TimeoutError, ConnectionError, OSError)):
+            # Recoverable network errors - continue to next server
+            self._logger.warning(
+                f"Failed to connect to MCP server {server_config['name']}: {result}"
+            )
+            return
+        if isinstance(result, BaseException):
+            # Non-recoverable or unexpected errors - log full stack trace
+            self._logger.error(
+                f"Unexpected error connecting to MCP server {server_config['name']}: {result}\n"
+                f"{''.join(traceback.format_exception(result))}"
+            )
+            return
+        
+        connection = result
+        if connection and connection.connected:
+            # Replace any previous connection to this server in place
+            previous = self._connected_servers.get(connection.name)
+            if previous is not None and previous.url != connection.url:
+                self._servers_by_url.pop(previous.url, None)
+            self._connected_servers[connection.name] = connection
+            self._servers_by_url[connection.url] = connection
+            self._crewai_server_cache = None
+            all_tools.extend(connection.tools)
+            catalog[connection.url] = connection.tools
+            
+            # Index tools by name for quick lookup
+            for tool in connection.tools:
+                self._tools_by_name[tool.name] = tool
+            
+            self._logger.info(
+                f"Connected to MCP server '{connection.name}' with "
+                f"{len(connection.tools)} tools"
+            )
+
     async def _connect_to_server(
         self,
         name: str,
         url: str,
         auth_token: str,
+        tools: Optional[List[MCPToolDefinition]] = None,
+        connect_timeout: float = MCP_CONNECT_TIMEOUT_SECONDS,
     ) -> Optional[MCPServerConnection]:
         """
         Connect to an MCP server and fetch its tools.
@@ -332,10 +928,16 @@ class McpToolRegistrationService:
             name: Server display name.
             url: Server URL endpoint.
             auth_token: Authentication token.
+            tools: Cached tool definitions; when provided, tools/list is skipped.
+            connect_timeout: TCP connect timeout in seconds for tools/list.
             
         Returns:
             MCPServerConnection with tools, or None if connection failed.
         """
+        if not self._breaker_allows(url):
+            self._logger.warning(f"⚡ Skipping MCP server {name} - circuit open")
+            return None
+        
         # Check if this is a local server (no auth needed)
         is_local = url.startswith("http://localhost") or url.startswith("http://127.0.0.1")
         
@@ -361,14 +963,30 @@ class McpToolRegistrationService:
             headers=headers,
         )
         
+        # A recovering server is probed with a real tools/list, so the probe
+        # records an outcome instead of being answered from the cached catalog
+        breaker = self._breakers.get(url)
+        if tools is not None and breaker is not None and breaker.status != BreakerStatus.CLOSED:
+            tools = None
+        
         try:
-            # Fetch available tools from the server
-            tools = await self._list_server_tools(url, headers, name)
+            # Fetch available tools from the server unless already cached
+            if tools is not None:
+                self._server_stats.setdefault(url, ServerStats()).cache_hits += 1
+            else:
+                started = time.monotonic()
+                tools = await self._list_server_tools(
+                    url, connection.request_headers, name, connect_timeout=connect_timeout
+                )
+                self._record_server_stats(url, time.monotonic() - started)
+                self._record_success(url)
             connection.tools = tools
             connection.connected = True
             return connection
             
         except Exception as e:
+            self._record_server_stats(url, None)
+            self._record_failure(url)
             self._logger.error(f"Failed to connect to MCP server {name} at {url}: {e}")
             return None
 
@@ -389,42 +1007,36 @@ class McpToolRegistrationService:
         
         # If it's regular JSON, parse directly
         if 'application/json' in content_type:
-            return await response.json()
+            return orjson.loads(await response.read())
         
-        # Handle SSE (text/event-stream)
+        # Handle SSE (text/event-stream). Lines are inspected as raw bytes so
+        # comments and non-data fields (event:, id:, retry:) are never decoded.
         result = None
         async for line in response.content:
-            line_str = line.decode('utf-8').strip()
-            
-            # Skip empty lines and comments
-            if not line_str or line_str.startswith(':'):
-                continue
+            line = line.strip()
             
             # Parse SSE data lines
-            if line_str.startswith('data:'):
-                data_str = line_str[5:].strip()
-                if data_str:
-                    try:
-                        parsed = json.loads(data_str)
-                        # Look for the JSON-RPC result
-                        if 'result' in parsed or 'error' in parsed:
-                            result = parsed
-                            break
-                        # Some servers send the result directly
-                        if 'jsonrpc' in parsed:
-                            result = parsed
-                            break
-                    except json.JSONDecodeError:
-                        continue
+            if line.startswith(b'data:'):
+                data = line[5:].strip()
             # Handle non-prefixed JSON lines (some SSE implementations)
-            elif line_str.startswith('{'):
-                try:
-                    parsed = json.loads(line_str)
-                    if 'result' in parsed or 'jsonrpc' in parsed:
-                        result = parsed
-                        break
-                except json.JSONDecodeError:
-                    continue
+            elif line.startswith(b'{'):
+                data = line
+            # Skip empty lines, comments and other SSE fields
+            else:
+                continue
+            
+            if not data:
+                continue
+            
+            try:
+                parsed = orjson.loads(data)
+            except ValueError:
+                continue
+            
+            # Look for the JSON-RPC result; some servers send the result directly
+            if 'result' in parsed or 'error' in parsed or 'jsonrpc' in parsed:
+                result = parsed
+                break
         
         if result is None:
             raise Exception("No valid JSON-RPC response found in SSE stream")
@@ -436,56 +1048,59 @@ class McpToolRegistrationService:
         server_url: str,
         headers: Dict[str, str],
         server_name: str,
+        connect_timeout: float = MCP_CONNECT_TIMEOUT_SECONDS,
     ) -> List[MCPToolDefinition]:
         """
         List available tools from an MCP server.
         
         Args:
             server_url: The MCP server URL endpoint.
-            headers: HTTP headers including authorization.
+            headers: Full request headers including authorization and Accept.
             server_name: Server name for tool attribution.
+            connect_timeout: TCP connect timeout in seconds.
             
         Returns:
             List of tool definitions.
         """
         payload = {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._request_ids),
             "method": "tools/list",
             "params": {}
         }
         
-        # Add Accept header for SSE
-        request_headers = {**headers, "Accept": "text/event-stream, application/json"}
+        # Serialize once with orjson; Content-Type is already set in the headers
+        body = orjson.dumps(payload)
         
         # Configure timeout for production
         timeout = aiohttp.ClientTimeout(
             total=MCP_REQUEST_TIMEOUT_SECONDS,
-            connect=MCP_CONNECT_TIMEOUT_SECONDS
+            connect=connect_timeout
         )
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(server_url, headers=request_headers, json=payload) as response:
-                if response.status == 200:
-                    result = await self._parse_sse_response(response)
-                    tools_data = result.get("result", {}).get("tools", [])
-                    
-                    tools = []
-                    for tool_data in tools_data:
-                        tool = MCPToolDefinition(
-                            name=tool_data.get("name", ""),
-                            description=tool_data.get("description", ""),
-                            input_schema=tool_data.get("inputSchema", {}),
-                            server_url=server_url,
-                            server_name=server_name,
-                        )
-                        tools.append(tool)
-                    
-                    self._logger.debug(f"Listed {len(tools)} tools from {server_name}")
-                    return tools
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Failed to list tools: {response.status} - {error_text}")
+        session = await self._get_session()
+        async with session.post(server_url, headers=headers, data=body, timeout=timeout) as response:
+            if response.status == 200:
+                result = await self._parse_sse_response(response)
+                tools_data = result.get("result", {}).get("tools", [])
+                
+                tools = []
+                for tool_data in tools_data:
+                    tool = MCPToolDefinition(
+                        name=tool_data.get("name", ""),
+                        description=tool_data.get("description", ""),
+                        input_schema=tool_data.get("inputSchema", {}),
+                        server_url=server_url,
+                        server_name=server_name,
+                        read_only=bool((tool_data.get("annotations") or {}).get("readOnlyHint", False)),
+                    )
+                    tools.append(tool)
+                
+                self._logger.debug(f"Listed {len(tools)} tools from {server_name}")
+                return tools
+            else:
+                error_text = await response.text()
+                raise Exception(f"Failed to list tools: {response.status} - {error_text}")
 
     async def call_tool(
         self,
@@ -495,7 +1110,9 @@ class McpToolRegistrationService:
         """
         Execute an MCP tool and return the result.
         
-        Includes retry logic for transient failures and proper timeout handling.
+        When MCP_BATCH_WINDOW_MS is set, calls to the same server that arrive within
+        that window of each other are coalesced into a single JSON-RPC batch request. Includes retry
+        logic for transient failures and proper timeout handling.
         
         Args:
             tool_name: Name of the tool to execute.
@@ -515,18 +1132,34 @@ class McpToolRegistrationService:
         tool = self._tools_by_name[tool_name]
         
         # Find the connection for this tool
-        connection = None
-        for conn in self._connected_servers:
-            if conn.url == tool.server_url:
-                connection = conn
-                break
+        connection = self._servers_by_url.get(tool.server_url)
         
         if not connection:
             raise ValueError(f"No connection found for tool '{tool_name}'")
         
+        # Identical calls to read-only tools by the same caller are served from memory.
+        # This is checked before the breaker so a cache hit never takes the half-open probe.
+        cache_key = None
+        if tool.read_only:
+            cache_key = (
+                self._identity_key(connection.request_headers),
+                tool_name,
+                orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS),
+            )
+            cached = self._get_read_only_result(cache_key)
+            if cached is not None:
+                self._logger.info(f"📦 Using cached result for read-only MCP tool '{tool_name}'")
+                return cached
+        
+        if not self._breaker_allows(connection.url):
+            raise Exception(
+                f"MCP server '{connection.name}' is unavailable (circuit open); "
+                f"retry in {MCP_BREAKER_COOLDOWN_SECONDS}s"
+            )
+        
         payload = {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -537,67 +1170,370 @@ class McpToolRegistrationService:
         self._logger.info(f"Calling MCP tool '{tool_name}' on server '{connection.name}'")
         self._logger.debug(f"Tool arguments: {arguments}")
         
-        # Add Accept header for SSE
-        request_headers = {**connection.headers, "Accept": "text/event-stream, application/json"}
+        result = await self._dispatch_tool_call(connection, payload)
+        if cache_key is not None:
+            self._store_read_only_result(cache_key, result)
+        return result
+
+    def _get_read_only_result(self, key: Tuple[str, str, bytes]) -> Optional[str]:
+        """
+        Get a memoized read-only tool result if it has not expired.
         
-        # Configure timeout for production
+        Args:
+            key: Caller identity hash, tool name and serialized arguments.
+            
+        Returns:
+            The cached result, or None on a miss.
+        """
+        entry = self._read_only_results.get(key)
+        if entry is None:
+            return None
+        timestamp, result = entry
+        ttl = _get_int_env("MCP_READ_ONLY_CACHE_TTL", DEFAULT_MCP_READ_ONLY_CACHE_TTL_SECONDS)
+        if time.monotonic() - timestamp > ttl:
+            del self._read_only_results[key]
+            return None
+        self._read_only_results.move_to_end(key)
+        return result
+
+    def _store_read_only_result(self, key: Tuple[str, str, bytes], result: str) -> None:
+        """Memoize a read-only tool result, evicting the least recently used entry when full."""
+        if _get_int_env("MCP_READ_ONLY_CACHE_TTL", DEFAULT_MCP_READ_ONLY_CACHE_TTL_SECONDS) <= 0:
+            return
+        self._read_only_results[key] = (time.monotonic(), result)
+        self._read_only_results.move_to_end(key)
+        while len(self._read_only_results) > MCP_READ_ONLY_CACHE_MAX_ENTRIES:
+            self._read_only_results.popitem(last=False)
+
+    async def _dispatch_tool_call(
+        self,
+        connection: MCPServerConnection,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Send a tools/call request, batching it with other calls to the same server.
+        
+        Args:
+            connection: The target server connection.
+            payload: The JSON-RPC request envelope.
+            
+        Returns:
+            The tool result as a string.
+        """
+        batch_window_ms = _get_int_env("MCP_BATCH_WINDOW_MS", DEFAULT_MCP_BATCH_WINDOW_MS)
+        if batch_window_ms <= 0 or connection.url in self._batch_unsupported:
+            return await self._send_tool_call(connection, payload)
+        
+        # Queue the call; the first call in a window schedules the flush
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(loop, {})
+        future = loop.create_future()
+        queue = pending.get(connection.url)
+        if queue is None:
+            queue = pending[connection.url] = []
+            task = asyncio.create_task(self._flush_batch(connection, batch_window_ms / 1000))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        queue.append((future, payload))
+        
+        return await future
+
+    async def _flush_batch(self, connection: MCPServerConnection, window_seconds: float) -> None:
+        """
+        Send the calls queued for a server once the batching window closes.
+        
+        A single queued call is sent on its own. Several calls are sent as one
+        JSON-RPC batch. The calls are only resent individually when the batch
+        provably never ran (the connection could not be opened, or the server
+        rejected batching); otherwise a failed batch or a missing response fails
+        the affected calls, since tools such as send-mail must not run twice.
+        
+        Args:
+            connection: The server whose queue to flush.
+            window_seconds: How long to wait for more calls before sending.
+        """
+        await asyncio.sleep(window_seconds)
+        queue = self._pending[asyncio.get_running_loop()].pop(connection.url, [])
+        
+        if len(queue) > 1:
+            self._logger.info(f"Sending {len(queue)} batched MCP tool calls to server '{connection.name}'")
+            try:
+                responses = await self._send_batch(connection, [payload for _, payload in queue])
+            except aiohttp.ClientConnectorError as e:
+                # The connection was never opened, so no call reached the server
+                self._logger.warning(f"⚠️ Could not connect to '{connection.name}' for batch, sending individually: {e}")
+                responses = None
+            except Exception as e:
+                self._logger.error(f"Batched MCP call to '{connection.name}' failed: {e}")
+                for future, _ in queue:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            
+            if responses is not None:
+                for future, payload in queue:
+                    if future.done():
+                        continue
+                    tool_name = payload["params"]["name"]
+                    response = responses.get(payload["id"])
+                    try:
+                        if response is None:
+                            raise Exception(f"No response for batched MCP tool call '{tool_name}'")
+                        future.set_result(self._extract_tool_result(response, tool_name))
+                    except Exception as e:
+                        future.set_exception(e)
+                queue = []
+        
+        async def send_single(future: asyncio.Future, payload: Dict[str, Any]) -> None:
+            try:
+                result = await self._send_tool_call(connection, payload)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+        
+        await asyncio.gather(*(send_single(future, payload) for future, payload in queue))
+
+    async def _send_batch(
+        self,
+        connection: MCPServerConnection,
+        payloads: List[Dict[str, Any]],
+    ) -> Optional[Dict[Any, Dict[str, Any]]]:
+        """
+        Send several tools/call requests to a server as one JSON-RPC batch.
+        
+        Args:
+            connection: The target server connection.
+            payloads: JSON-RPC request envelopes, each with a unique id.
+            
+        Returns:
+            Mapping of request id to its JSON-RPC response, or None if the server
+            rejected the batch without running any of its calls.
+            
+        Raises:
+            Exception: If the batch request fails.
+        """
+        body = orjson.dumps(payloads)
         timeout = aiohttp.ClientTimeout(
             total=MCP_REQUEST_TIMEOUT_SECONDS,
             connect=MCP_CONNECT_TIMEOUT_SECONDS
         )
         
-        last_error = None
-        for attempt in range(MCP_MAX_RETRIES + 1):
+        async with self._acquire_session(connection.url, connection.request_headers) as pooled:
+            headers = connection.request_headers
+            if pooled.session_id:
+                headers = {**headers, MCP_SESSION_ID_HEADER: pooled.session_id}
+            
+            session = await self._get_session()
+            async with session.post(
+                connection.url,
+                headers=headers,
+                data=body,
+                timeout=timeout,
+            ) as response:
+                pooled.session_id = response.headers.get(MCP_SESSION_ID_HEADER, pooled.session_id)
+                
+                if response.status == 400:
+                    # Server does not accept JSON-RPC batches; stop batching for it
+                    self._batch_unsupported.add(connection.url)
+                    self._logger.info(f"MCP server '{connection.name}' does not accept batches, sending individually")
+                    return None
+                if response.status != 200:
+                    error_text = await response.text()
+                    if response.status >= 500:
+                        self._record_failure(connection.url)
+                    else:
+                        self._record_success(connection.url)
+                    raise Exception(f"MCP batch call failed: {response.status} - {error_text}")
+                
+                try:
+                    messages = await self._parse_batch_response(response)
+                except (asyncio.TimeoutError, aiohttp.ClientError):
+                    raise
+                except Exception:
+                    self._record_failure(connection.url)
+                    raise
+        
+        self._record_success(connection.url)
+        return {message["id"]: message for message in messages if "id" in message}
+
+    async def _parse_batch_response(self, response) -> List[Dict[str, Any]]:
+        """
+        Parse a JSON-RPC batch response, sent either as a JSON array or as SSE.
+        
+        Args:
+            response: aiohttp response object
+            
+        Returns:
+            List of JSON-RPC response messages.
+        """
+        content_type = response.headers.get('Content-Type', '')
+        
+        if 'application/json' in content_type:
+            parsed = orjson.loads(await response.read())
+            return parsed if isinstance(parsed, list) else [parsed]
+        
+        messages = []
+        async for line in response.content:
+            line = line.strip()
+            if line.startswith(b'data:'):
+                data = line[5:].strip()
+            elif line.startswith((b'{', b'[')):
+                data = line
+            else:
+                continue
+            
+            if not data:
+                continue
+            
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
+                parsed = orjson.loads(data)
+            except ValueError:
+                continue
+            
+            messages.extend(parsed if isinstance(parsed, list) else [parsed])
+        
+        return [message for message in messages if isinstance(message, dict)]
+
+    def _extract_tool_result(self, result: Dict[str, Any], tool_name: str) -> str:
+        """
+        Extract the text of a tools/call JSON-RPC response.
+        
+        Args:
+            result: The JSON-RPC response message.
+            tool_name: Name of the tool that was called.
+            
+        Returns:
+            The tool result as a string.
+            
+        Raises:
+            Exception: If the response is a JSON-RPC error.
+        """
+        error = result.get("error")
+        if error:
+            if isinstance(error, dict):
+                raise Exception(
+                    f"MCP tool '{tool_name}' returned error {error.get('code')}: {error.get('message', '')}"
+                )
+            raise Exception(f"MCP tool '{tool_name}' returned error: {error}")
+        
+        # Extract content from MCP response
+        content = result.get("result", {}).get("content", [])
+        if content and len(content) > 0:
+            # Handle different content types
+            first_content = content[0]
+            if isinstance(first_content, dict):
+                result_text = first_content.get("text", str(first_content))
+            else:
+                result_text = str(first_content)
+            
+            self._logger.info(f"MCP tool '{tool_name}' executed successfully")
+            return result_text
+        
+        return str(result.get("result", ""))
+
+    async def _send_tool_call(
+        self,
+        connection: MCPServerConnection,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Send a single tools/call request, retrying transient failures.
+        
+        Args:
+            connection: The target server connection.
+            payload: The JSON-RPC request envelope.
+            
+        Returns:
+            The tool result as a string.
+            
+        Raises:
+            Exception: If the tool call fails after retries.
+        """
+        tool_name = payload["params"]["name"]
+        
+        # Serialize once with orjson; Content-Type is already set in the headers
+        body = orjson.dumps(payload)
+        request_headers = connection.request_headers
+        
+        # Configure timeout for production
+        timeout = aiohttp.ClientTimeout(
+            total=MCP_REQUEST_TIMEOUT_SECONDS,
+            connect=MCP_CONNECT_TIMEOUT_SECONDS
+        )
+        
+        async with self._acquire_session(connection.url, request_headers) as pooled:
+            last_error = None
+            for attempt in range(MCP_MAX_RETRIES + 1):
+                try:
+                    headers = request_headers
+                    if pooled.session_id:
+                        headers = {**request_headers, MCP_SESSION_ID_HEADER: pooled.session_id}
+                    
+                    session = await self._get_session()
                     async with session.post(
                         connection.url,
-                        headers=request_headers,
-                        json=payload
+                        headers=headers,
+                        data=body,
+                        timeout=timeout,
                     ) as response:
-                        if response.status == 200:
-                            result = await self._parse_sse_response(response)
-                            
-                            # Extract content from MCP response
-                            content = result.get("result", {}).get("content", [])
-                            if content and len(content) > 0:
-                                # Handle different content types
-                                first_content = content[0]
-                                if isinstance(first_content, dict):
-                                    result_text = first_content.get("text", str(first_content))
-                                else:
-                                    result_text = str(first_content)
-                                
-                                self._logger.info(f"MCP tool '{tool_name}' executed successfully")
-                                return result_text
-                            
-                            return str(result.get("result", ""))
+                        pooled.session_id = response.headers.get(MCP_SESSION_ID_HEADER, pooled.session_id)
                         
+                        if response.status == 200:
+                            try:
+                                result = await self._parse_sse_response(response)
+                            except (asyncio.TimeoutError, aiohttp.ClientError):
+                                raise
+                            except Exception:
+                                self._record_failure(connection.url)
+                                raise
+                            if not _is_jsonrpc_reply(result):
+                                self._record_failure(connection.url)
+                                raise Exception(f"Malformed MCP response for tool '{tool_name}': {result}")
+                            # A JSON-RPC tool error still shows the server is up
+                            self._record_success(connection.url)
+                            return self._extract_tool_result(result, tool_name)
+                    
                         elif response.status in (502, 503, 504):
                             # Retryable server errors
                             error_text = await response.text()
                             last_error = Exception(f"MCP server error: {response.status} - {error_text}")
                             self._logger.warning(f"Retryable error on attempt {attempt + 1}: {response.status}")
+                        elif response.status == 404 and MCP_SESSION_ID_HEADER in headers:
+                            # Server-side session expired - retry without it
+                            pooled.session_id = None
+                            last_error = Exception("MCP session expired")
+                            self._logger.warning(f"MCP session expired on attempt {attempt + 1}")
                         else:
-                            # Non-retryable error
+                            # Non-retryable error; a 4xx comes from a live server, a 5xx does not
                             error_text = await response.text()
+                            if response.status >= 500:
+                                self._record_failure(connection.url)
+                            else:
+                                self._record_success(connection.url)
                             raise Exception(f"MCP tool call failed: {response.status} - {error_text}")
-                            
-            except asyncio.TimeoutError:
-                last_error = Exception(f"MCP tool call timed out after {MCP_REQUEST_TIMEOUT_SECONDS}s")
-                self._logger.warning(f"Timeout on attempt {attempt + 1} for tool '{tool_name}'")
-            except aiohttp.ClientError as e:
-                last_error = e
-                self._logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
-            
-            # Wait before retry with exponential backoff and jitter (except on last attempt)
-            if attempt < MCP_MAX_RETRIES:
-                # Exponential backoff: base_delay * 2^attempt + random jitter (0-0.5s)
-                delay = MCP_RETRY_BASE_DELAY_SECONDS * (2 ** attempt) + random.uniform(0, 0.5)
-                self._logger.info(f"Retrying in {delay:.2f}s...")
-                await asyncio.sleep(delay)
+                        
+                except asyncio.TimeoutError:
+                    last_error = Exception(f"MCP tool call timed out after {MCP_REQUEST_TIMEOUT_SECONDS}s")
+                    self._logger.warning(f"Timeout on attempt {attempt + 1} for tool '{tool_name}'")
+                except aiohttp.ClientError as e:
+                    last_error = e
+                    self._logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
+            
+                # Wait before retry with exponential backoff and full jitter (except on last attempt)
+                if attempt < MCP_MAX_RETRIES:
+                    # Uniform in [0, min(cap, base_delay * 2^attempt)] so concurrent
+                    # callers failing together spread their retries out
+                    delay = random.uniform(
+                        0, min(MCP_MAX_RETRY_DELAY_SECONDS, MCP_RETRY_BASE_DELAY_SECONDS * (2 ** attempt))
+                    )
+                    self._logger.info(f"Retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
         
         # All retries exhausted
+        self._record_failure(connection.url)
         self._logger.error(f"MCP tool '{tool_name}' failed after {MCP_MAX_RETRIES + 1} attempts")
         raise last_error or Exception("MCP tool call failed")
 
@@ -608,9 +1544,12 @@ class McpToolRegistrationService:
         Returns:
             List of MCP server configurations formatted for CrewAI.
         """
+        if self._crewai_server_cache is not None:
+            return self._crewai_server_cache
+        
         crewai_mcp_servers = []
         
-        for connection in self._connected_servers:
+        for connection in self._connected_servers.values():
             crewai_mcp_servers.append({
                 "id": connection.name,
                 "transport": "sse",
@@ -620,6 +1559,7 @@ class McpToolRegistrationService:
                 },
             })
         
+        self._crewai_server_cache = crewai_mcp_servers
         return crewai_mcp_servers
 
     def get_available_tool_names(self) -> List[str]:
@@ -643,9 +1583,27 @@ class McpToolRegistrationService:
         """
         return self._tools_by_name.get(name)
 
+    async def close_loop_session(self) -> None:
+        """Close the pooled HTTP session of the running event loop, before that loop ends."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+
     async def cleanup(self):
         """Clean up all connected MCP servers."""
-        self._connected_servers = []
+        await self.close_loop_session()
+        # Sessions of loops still running in other threads are closed on their own loop
+        for loop, session in list(self._sessions.items()):
+            if not session.closed and loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+        self._sessions.clear()
+        self._session_pool.clear()
+        self._breakers.clear()
+        self._batch_unsupported.clear()
+        self._read_only_results.clear()
+        self._connected_servers = {}
+        self._crewai_server_cache = None
+        self._servers_by_url = {}
         self._tools_by_name = {}
         self._auth_token = None
         self._logger.info("MCP tool registration service cleaned up")
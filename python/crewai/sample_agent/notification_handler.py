@@ -9,6 +9,7 @@ This module separates notification handling logic from the main agent for better
 """
 
 import logging
+import os
 from typing import TYPE_CHECKING, Any
 
 from microsoft_agents.hosting.core import Authorization, TurnContext
@@ -19,6 +20,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Longest email body passed to the agent; longer (usually HTML) bodies are truncated
+DEFAULT_MAX_EMAIL_CHARS = 50000
+
+
+def _get_max_email_chars() -> int:
+    """Read EMAIL_MAX_CHARS, falling back to the default when it is unset, empty or invalid."""
+    try:
+        return int(os.getenv("EMAIL_MAX_CHARS") or DEFAULT_MAX_EMAIL_CHARS)
+    except ValueError:
+        return DEFAULT_MAX_EMAIL_CHARS
+
+
+MAX_EMAIL_CHARS = _get_max_email_chars()
+
+_EMAIL_PROMPT = "You have received the following email. Please follow any instructions in it.\n\n"
+
 
 async def handle_notification(
     agent: "CrewAIAgent",
@@ -42,35 +59,17 @@ async def handle_notification(
     """
     try:
         notification_type = notification_activity.notification_type
-        logger.info(f"📬 Processing notification: {notification_type}")
+        logger.info("📬 Processing notification: %s", notification_type)
 
-        # Validate notification_type before comparisons
         if notification_type is None:
             logger.warning("Received notification with None notification_type")
-            return await _handle_generic_notification(
-                agent, notification_activity, auth, context, auth_handler_name
-            )
-
-        # Handle Email Notifications
-        if notification_type == NotificationTypes.EMAIL_NOTIFICATION:
-            return await _handle_email_notification(
-                agent, notification_activity, auth, context, auth_handler_name
-            )
-
-        # Handle Word Comment Notifications
-        elif notification_type == NotificationTypes.WPX_COMMENT:
-            return await _handle_word_notification(
-                agent, notification_activity, auth, context, auth_handler_name
-            )
-
-        # Generic notification handling
-        else:
-            return await _handle_generic_notification(
-                agent, notification_activity, auth, context, auth_handler_name
-            )
+
+        # Unknown (and missing) notification types fall back to generic handling
+        handler = _HANDLERS.get(notification_type, _handle_generic_notification)
+        return await handler(agent, notification_activity, auth, context, auth_handler_name)
 
     except Exception as e:
-        logger.error(f"Error processing notification: {e}")
+        logger.error("Error processing notification: %s", e)
         logger.exception("Full error details:")
         return f"Sorry, I encountered an error processing the notification: {str(e)}"
 
@@ -87,9 +86,12 @@ async def _handle_email_notification(
         return "I could not find the email notification details."
 
     email = notification_activity.email
-    email_body = getattr(email, "html_body", "") or getattr(email, "body", "")
+    email_body = getattr(email, "html_body", None) or getattr(email, "body", "") or ""
+    if len(email_body) > MAX_EMAIL_CHARS:
+        logger.info("✂️ Truncating email body from %d to %d characters", len(email_body), MAX_EMAIL_CHARS)
+        email_body = email_body[:MAX_EMAIL_CHARS]
 
-    message = f"You have received the following email. Please follow any instructions in it.\n\n{email_body}"
+    message = _EMAIL_PROMPT + email_body
     logger.info("📧 Processing email notification")
 
     response = await agent.process_user_message(message, auth, auth_handler_name, context)
@@ -111,7 +113,7 @@ async def _handle_word_notification(
     doc_id = getattr(wpx, "document_id", "")
     comment_text = notification_activity.text or ""
 
-    logger.info(f"📄 Processing Word comment notification for doc {doc_id}")
+    logger.info("📄 Processing Word comment notification for doc %s", doc_id)
 
     message = (
         f"You have been mentioned in a Word document comment.\n"
@@ -132,20 +134,33 @@ async def _handle_generic_notification(
     auth_handler_name: str | None,
 ) -> str:
     """Handle generic notification activities."""
-    logger.info("🔍 Full notification activity structure:")
-    logger.info(f"   Type: {notification_activity.activity.type}")
-    logger.info(f"   Name: {notification_activity.activity.name}")
-    logger.info(f"   Text: {getattr(notification_activity.activity, 'text', 'N/A')}")
-    logger.info(f"   Value: {getattr(notification_activity.activity, 'value', 'N/A')}")
-    logger.info(f"   Entities: {notification_activity.activity.entities}")
-    logger.info(f"   Channel ID: {notification_activity.activity.channel_id}")
-
-    notification_message = (
-        getattr(notification_activity.activity, 'text', None) or
-        str(getattr(notification_activity.activity, 'value', None)) or
-        f"Notification received: {notification_activity.notification_type}"
-    )
-    logger.info(f"📨 Processing generic notification: {notification_activity.notification_type}")
+    activity = notification_activity.activity
+
+    # Only stringify the activity (entities can be large) when INFO is emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🔍 Full notification activity structure:")
+        logger.info("   Type: %s", activity.type)
+        logger.info("   Name: %s", activity.name)
+        logger.info("   Text: %s", getattr(activity, 'text', 'N/A'))
+        logger.info("   Value: %s", getattr(activity, 'value', 'N/A'))
+        logger.info("   Entities: %s", activity.entities)
+        logger.info("   Channel ID: %s", activity.channel_id)
+
+    notification_message = getattr(activity, 'text', None)
+    if not notification_message:
+        value = getattr(activity, 'value', None)
+        if value is not None:
+            notification_message = str(value)
+        else:
+            notification_message = f"Notification received: {notification_activity.notification_type}"
+    logger.info("📨 Processing generic notification: %s", notification_activity.notification_type)
 
     response = await agent.process_user_message(notification_message, auth, auth_handler_name, context)
     return response or "Notification processed successfully."
+
+
+# Notification type -> handler, looked up once per notification
+_HANDLERS = {
+    NotificationTypes.EMAIL_NOTIFICATION: _handle_email_notification,
+    NotificationTypes.WPX_COMMENT: _handle_word_notification,
+}
@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""
+Observability Configuration Module
+
+Single, idempotent entry point for configuring the Agent 365 Observability SDK.
+
+Both start_with_generic_host.py (before CrewAI is imported) and create_and_run_host()
+call initialize_observability(). Only the first call configures the SDK, so the
+TracerProvider, span processor and exporter are never created twice.
+"""
+
+import logging
+import os
+from threading import Lock
+
+from constants import DEFAULT_SERVICE_NAME, DEFAULT_SERVICE_NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+# Serializes the first configuration so concurrent callers cannot both configure
+_configure_lock = Lock()
+
+# Flag to track if observability has been configured
+_observability_configured = False
+
+# token_resolver logs the first missing token, then one per this many misses (power of two minus one)
+TOKEN_RESOLVER_LOG_SAMPLE_MASK = 1023
+_token_misses = 0
+
+# BatchSpanProcessor defaults sized for bursty agent traffic; explicit
+# OTEL_BSP_* environment variables still take precedence
+_BSP_ENV_DEFAULTS = {
+    "OTEL_BSP_MAX_QUEUE_SIZE": "4096",
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": "512",
+    "OTEL_BSP_SCHEDULE_DELAY": "2000",
+}
+
+
+def is_observability_enabled() -> bool:
+    """Check the ENABLE_OBSERVABILITY environment variable (enabled by default)."""
+    return os.getenv("ENABLE_OBSERVABILITY", "true").lower() in ("true", "1", "yes")
+
+
+def _do_configure(service_name: str, service_namespace: str, cluster_category: str) -> bool:
+    """Configure the SDK unless already configured; a failed attempt is retried by the next call."""
+    global _observability_configured
+
+    if _observability_configured:
+        return True
+
+    # Imported here so a disabled deployment never loads the observability SDK
+    from microsoft_agents_a365.observability.core.config import configure
+    from token_cache import get_cached_agentic_token
+
+    def token_resolver(agent_id: str, tenant_id: str) -> str | None:
+        """Resolve authentication token for observability exporter (runs on every export)"""
+        global _token_misses
+
+        token = get_cached_agentic_token(tenant_id, agent_id)
+        if token is None:
+            _token_misses += 1
+            if ((_token_misses - 1) & TOKEN_RESOLVER_LOG_SAMPLE_MASK) == 0:
+                logger.warning(
+                    "No cached agentic token for %s:%s (%d miss(es) so far)", agent_id, tenant_id, _token_misses
+                )
+        return token
+
+    try:
+        configure(
+            service_name=service_name,
+            service_namespace=service_namespace,
+            token_resolver=token_resolver,
+            cluster_category=cluster_category,
+        )
+    except Exception as e:
+        logger.warning("⚠️ Failed to configure observability: %s", e)
+        return False
+
+    _observability_configured = True
+    logger.info("✅ Observability configured: %s (%s)", service_name, service_namespace)
+    return True
+
+
+def initialize_observability() -> bool:
+    """
+    Configure observability once per process.
+
+    Returns:
+        True if observability is configured, False if it is disabled or configuration failed.
+    """
+    if not is_observability_enabled():
+        return False
+
+    for name, value in _BSP_ENV_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+
+    with _configure_lock:
+        return _do_configure(
+            os.getenv("OBSERVABILITY_SERVICE_NAME", DEFAULT_SERVICE_NAME),
+            os.getenv("OBSERVABILITY_SERVICE_NAMESPACE", DEFAULT_SERVICE_NAMESPACE),
+            os.getenv("PYTHON_ENVIRONMENT", "development"),
+        )
+
+
+def is_observability_configured() -> bool:
+    """Check if observability has been configured"""
+    return _observability_configured
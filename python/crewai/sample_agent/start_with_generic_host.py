@@ -8,21 +8,31 @@ IMPORTANT: Observability must be configured BEFORE importing CrewAI
 to prevent CrewAI from setting up its own TracerProvider.
 """
 
-import sys
 import os
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
 
 # -----------------------------------------------------------------------------
 # Ensure ChromaDB has a compatible sqlite3 (App Service images can be too old)
 # -----------------------------------------------------------------------------
-try:
-    import pysqlite3  # type: ignore
+def _install_pysqlite():
+    """Swap in pysqlite3 for sqlite3 so ChromaDB (CrewAI memory) gets a recent SQLite."""
+    try:
+        import pysqlite3  # type: ignore
 
-    sys.modules["sqlite3"] = pysqlite3
-except (ImportError, ModuleNotFoundError):
-    # Fall back to built-in sqlite3; may fail if version is too old
-    pass
+        sys.modules["sqlite3"] = pysqlite3
+    except (ImportError, ModuleNotFoundError):
+        # Fall back to built-in sqlite3; may fail if version is too old
+        pass
 
-from constants import DEFAULT_SERVICE_NAME, DEFAULT_SERVICE_NAMESPACE
+
+# Skip the swap when ChromaDB is not used (USE_CHROMADB=false)
+if os.getenv("USE_CHROMADB", "true").lower() in ("true", "1", "yes"):
+    _install_pysqlite()
 
 # ============================================================
 # CRITICAL: Configure observability BEFORE importing CrewAI
@@ -30,33 +40,20 @@ from constants import DEFAULT_SERVICE_NAME, DEFAULT_SERVICE_NAMESPACE
 # ============================================================
 def _configure_observability_early():
     """Configure observability before any CrewAI imports."""
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    enable_observability = os.getenv("ENABLE_OBSERVABILITY", "true").lower() in ("true", "1", "yes")
-    if not enable_observability:
-        print("ℹ️ Observability disabled (ENABLE_OBSERVABILITY=false)")
-        return
-    
     try:
-        # Import and configure observability FIRST
-        from microsoft_agents_a365.observability.core.config import configure as configure_observability
-        from token_cache import get_cached_agentic_token
-        
-        service_name = os.getenv("OBSERVABILITY_SERVICE_NAME", DEFAULT_SERVICE_NAME)
-        service_namespace = os.getenv("OBSERVABILITY_SERVICE_NAMESPACE", DEFAULT_SERVICE_NAMESPACE)
+        # Import and configure observability FIRST; create_and_run_host() goes
+        # through the same idempotent gate and will not configure it again.
+        # The observability SDK itself is only imported once enabled.
+        from observability_config import initialize_observability, is_observability_enabled
         
-        def token_resolver(agent_id: str, tenant_id: str) -> str | None:
-            """Resolve authentication token for observability exporter"""
-            return get_cached_agentic_token(tenant_id, agent_id)
+        if not is_observability_enabled():
+            print("ℹ️ Observability disabled (ENABLE_OBSERVABILITY=false)")
+            return
         
-        configure_observability(
-            service_name=service_name,
-            service_namespace=service_namespace,
-            token_resolver=token_resolver,
-            cluster_category=os.getenv("PYTHON_ENVIRONMENT", "development"),
-        )
-        print("✅ Observability configured (before CrewAI import)")
+        if initialize_observability():
+            print("✅ Observability configured (before CrewAI import)")
+        else:
+            print("⚠️ Failed to configure observability early")
     except Exception as e:
         print(f"⚠️ Failed to configure observability early: {e}")
 
@@ -15,7 +15,7 @@ Pattern:
 """
 
 import logging
-from threading import Lock
+import time
 
 from microsoft_agents_a365.observability.hosting.token_cache_helpers.agent_token_cache import (
     AgenticTokenCache,
@@ -27,10 +27,29 @@ logger = logging.getLogger(__name__)
 # SDK's token cache for observability registration
 _sdk_token_cache = AgenticTokenCache()
 
-# Sync cache for already-exchanged token strings
-# Key format: "agent_id:tenant_id" (matching SDK's format)
-_exchanged_tokens: dict[str, str] = {}
-_lock = Lock()
+# Default lifetime of a cached token; agentic tokens are issued for about an hour
+DEFAULT_TOKEN_TTL_SECONDS = 3000
+
+# How long a miss is remembered so repeated span exports skip the lookup and log
+NEGATIVE_CACHE_TTL_SECONDS = 5
+
+# Sync cache for already-exchanged token strings as (token, expiry on the monotonic clock)
+# Keyed agent_id -> tenant_id -> entry, so lookups never build an "agent_id:tenant_id" string.
+# No lock: single dict get/set/clear calls are atomic under the GIL, and the
+# token_resolver reads this on every span export from the exporter thread.
+_exchanged_tokens: dict[str, dict[str, tuple[str, float]]] = {}
+
+# Recent misses: agent_id -> tenant_id -> expiry on the monotonic clock
+_negative_cache: dict[str, dict[str, float]] = {}
+
+# Shared read-only fallback for agents with no entries
+_EMPTY: dict = {}
+
+
+def _store_token(agent_id: str, tenant_id: str, token: str, ttl_seconds: float) -> None:
+    """Store a token with its expiry and forget any recent miss for the same key."""
+    _exchanged_tokens.setdefault(agent_id, {})[tenant_id] = (token, time.monotonic() + ttl_seconds)
+    _negative_cache.get(agent_id, _EMPTY).pop(tenant_id, None)
 
 
 def register_observability(
@@ -74,15 +93,18 @@ async def get_and_cache_observability_token(agent_id: str, tenant_id: str) -> st
     
     if token:
         # Cache for sync access by token_resolver
-        cache_key = f"{agent_id}:{tenant_id}"
-        with _lock:
-            _exchanged_tokens[cache_key] = token
-        logger.debug(f"Cached exchanged token for {cache_key}")
+        _store_token(agent_id, tenant_id, token, DEFAULT_TOKEN_TTL_SECONDS)
+        logger.debug("Cached exchanged token for %s:%s", agent_id, tenant_id)
     
     return token
 
 
-def cache_agentic_token(tenant_id: str, agent_id: str, token: str) -> None:
+def cache_agentic_token(
+    tenant_id: str,
+    agent_id: str,
+    token: str,
+    ttl_seconds: float = DEFAULT_TOKEN_TTL_SECONDS,
+) -> None:
     """
     Cache an already-exchanged agentic token for sync access.
     
@@ -92,11 +114,10 @@ def cache_agentic_token(tenant_id: str, agent_id: str, token: str) -> None:
         tenant_id: Tenant identifier
         agent_id: Agent identifier
         token: Already-exchanged agentic authentication token
+        ttl_seconds: Seconds until the cached token is treated as expired
     """
-    cache_key = f"{agent_id}:{tenant_id}"
-    with _lock:
-        _exchanged_tokens[cache_key] = token
-    logger.debug(f"Cached agentic token for {cache_key}")
+    _store_token(agent_id, tenant_id, token, ttl_seconds)
+    logger.debug("Cached agentic token for %s:%s", agent_id, tenant_id)
 
 
 def get_cached_agentic_token(tenant_id: str, agent_id: str) -> str | None:
@@ -110,22 +131,30 @@ def get_cached_agentic_token(tenant_id: str, agent_id: str) -> str | None:
         agent_id: Agent identifier
 
     Returns:
-        Cached token if found, None otherwise
+        Cached token if found and not expired, None otherwise
     """
-    cache_key = f"{agent_id}:{tenant_id}"
-    with _lock:
-        token = _exchanged_tokens.get(cache_key)
+    now = time.monotonic()
 
-    if token:
-        logger.debug(f"Retrieved cached token for {cache_key}")
-    else:
-        logger.debug(f"No cached token found for {cache_key}")
+    tenant_tokens = _exchanged_tokens.get(agent_id, _EMPTY)
+    entry = tenant_tokens.get(tenant_id)
+    if entry is not None:
+        token, expires_at = entry
+        if now < expires_at:
+            return token
+        tenant_tokens.pop(tenant_id, None)
+        logger.debug("Cached token expired for %s:%s", agent_id, tenant_id)
 
-    return token
+    # A recent miss is answered without logging again
+    if _negative_cache.get(agent_id, _EMPTY).get(tenant_id, 0.0) > now:
+        return None
+
+    _negative_cache.setdefault(agent_id, {})[tenant_id] = now + NEGATIVE_CACHE_TTL_SECONDS
+    logger.debug("No cached token found for %s:%s", agent_id, tenant_id)
+    return None
 
 
 def clear_token_cache() -> None:
     """Clear all cached tokens."""
-    with _lock:
-        _exchanged_tokens.clear()
+    _exchanged_tokens.clear()
+    _negative_cache.clear()
     logger.debug("Token cache cleared")
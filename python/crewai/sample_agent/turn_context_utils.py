@@ -9,10 +9,12 @@ This module encapsulates repeated logic for extracting agent, caller, and
 tenant information from the Microsoft Agents SDK TurnContext.
 """
 
+import logging
 import os
 import uuid
-from dataclasses import dataclass
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import NamedTuple, Optional
 
 from microsoft_agents.hosting.core import TurnContext
 from microsoft_agents_a365.observability.core import (
@@ -28,8 +30,17 @@ from microsoft_agents_a365.observability.hosting.scope_helpers.populate_baggage
 
 from constants import DEFAULT_AGENT_ID
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Per-conversation details that do not change between turns, keyed by
+# (conversation_id, recipient id, caller id); only correlation_id is per turn
+_STATIC_DETAILS_CACHE_SIZE = 1024
+_static_details: "OrderedDict[tuple, TurnContextDetails]" = OrderedDict()
+_static_details_hits = 0
+_static_details_misses = 0
+
+
+@dataclass(frozen=True, slots=True)
 class TurnContextDetails:
     """Extracted details from a TurnContext for observability."""
 
@@ -51,43 +62,88 @@ class TurnContextDetails:
     caller_aad_object_id: Optional[str]
 
 
+class ObservabilityBundle(NamedTuple):
+    """All observability objects for one turn, built from a single TurnContextDetails."""
+
+    agent_details: AgentDetails
+    caller_details: CallerDetails
+    tenant_details: TenantDetails
+    request: Request
+    invoke_agent_details: InvokeAgentDetails
+
+
 def extract_turn_context_details(context: TurnContext) -> TurnContextDetails:
     """
     Extract observability details from a TurnContext.
 
+    Agent, caller and tenant fields are reused from earlier turns of the same
+    conversation; only the correlation id is generated per call.
+
     Args:
         context: The TurnContext from the Microsoft Agents SDK
 
     Returns:
         TurnContextDetails with all extracted information
     """
+    global _static_details_hits, _static_details_misses
+
     activity = context.activity
-    recipient = activity.recipient if activity.recipient else None
+    recipient = activity.recipient
+    caller = activity.from_property
+    conversation = activity.conversation
+    conversation_id = conversation.id if conversation else None
+
+    key = (conversation_id, getattr(recipient, "id", None), getattr(caller, "id", None))
+    static = _static_details.get(key)
+    if static is None:
+        _static_details_misses += 1
+        static = _extract_static_details(recipient, caller, conversation_id)
+        _static_details[key] = static
+        if len(_static_details) > _STATIC_DETAILS_CACHE_SIZE:
+            _static_details.popitem(last=False)
+        logger.debug(
+            "Turn context details cache miss (%d hits / %d misses)",
+            _static_details_hits, _static_details_misses,
+        )
+    else:
+        _static_details_hits += 1
+        _static_details.move_to_end(key)
 
-    # Extract agent details from recipient (ChannelAccount)
-    tenant_id = recipient.tenant_id if recipient else None
-    agent_id = getattr(recipient, "id", None) if recipient else None
+    # Dashed UUID string, the correlation id format telemetry consumers already see
+    return replace(static, correlation_id=str(uuid.uuid4()))
+
+
+def _extract_static_details(recipient, caller, conversation_id: Optional[str]) -> TurnContextDetails:
+    """
+    Read the per-conversation fields from the recipient and caller ChannelAccounts.
+
+    Args:
+        recipient: The activity recipient (the agent), or None
+        caller: The activity from_property (the user), or None
+        conversation_id: The conversation id, or None
+
+    Returns:
+        TurnContextDetails with an empty correlation_id
+    """
+    # Extract agent details from recipient (ChannelAccount); each field falls back
+    # to None on its own, so one missing attribute does not hide the others
+    tenant_id = getattr(recipient, "tenant_id", None)
+    agent_id = getattr(recipient, "id", None)
     if not agent_id:
         agent_id = os.getenv("AGENT_ID", DEFAULT_AGENT_ID)
-    agent_name = getattr(recipient, "name", None) if recipient else None
-    agent_upn = getattr(recipient, "name", None) if recipient else None
-    agent_blueprint_id = getattr(recipient, "agentic_app_id", None) if recipient else None
-    agent_auid = getattr(recipient, "agentic_user_id", None) if recipient else None
-
-    # Extract conversation details
-    conversation_id = activity.conversation.id if activity.conversation else None
-    correlation_id = str(uuid.uuid4())
+    agent_name = getattr(recipient, "name", None)
+    agent_upn = agent_name
+    agent_blueprint_id = getattr(recipient, "agentic_app_id", None)
+    agent_auid = getattr(recipient, "agentic_user_id", None)
 
     # Extract caller details from from_property (ChannelAccount)
-    caller = activity.from_property if activity and activity.from_property else None
     caller_id = getattr(caller, "id", None)
     caller_name = getattr(caller, "name", None)
     caller_aad_object_id = getattr(caller, "aad_object_id", None)
 
     # Warn if using fallback tenant_id to help identify configuration issues in production
     if not tenant_id:
-        import logging
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "tenant_id not found in TurnContext; using 'default-tenant'. "
             "This may make it difficult to distinguish between deployments in telemetry."
         )
@@ -100,7 +156,7 @@ def extract_turn_context_details(context: TurnContext) -> TurnContextDetails:
         agent_blueprint_id=agent_blueprint_id,
         agent_auid=agent_auid,
         conversation_id=conversation_id,
-        correlation_id=correlation_id,
+        correlation_id="",
         caller_id=caller_id,
         caller_name=caller_name,
         caller_aad_object_id=caller_aad_object_id,
@@ -179,24 +235,58 @@ def create_request(details: TurnContextDetails, message: str) -> Request:
     )
 
 
-def create_invoke_agent_details(details: TurnContextDetails, description: str = "AI agent powered by CrewAI framework") -> InvokeAgentDetails:
+def create_invoke_agent_details(
+    details: TurnContextDetails,
+    description: str = "AI agent powered by CrewAI framework",
+    agent_details: Optional[AgentDetails] = None,
+) -> InvokeAgentDetails:
     """
     Create InvokeAgentDetails from extracted TurnContextDetails.
 
     Args:
         details: The extracted turn context details
         description: Description of the agent
+        agent_details: Already-built AgentDetails to reuse instead of creating new ones
 
     Returns:
         InvokeAgentDetails for observability
     """
-    agent_details = create_agent_details(details, description)
+    if agent_details is None:
+        agent_details = create_agent_details(details, description)
     return InvokeAgentDetails(
         details=agent_details,
         session_id=details.conversation_id,
     )
 
 
+def build_observability_bundle(
+    details: TurnContextDetails,
+    message: str,
+    description: str = "AI agent powered by CrewAI framework",
+) -> ObservabilityBundle:
+    """
+    Create every observability object for a turn in one pass.
+
+    The AgentDetails instance is built once and shared with InvokeAgentDetails.
+
+    Args:
+        details: The extracted turn context details
+        message: The user message content
+        description: Description of the agent
+
+    Returns:
+        ObservabilityBundle with agent, caller, tenant, request and invoke details
+    """
+    agent_details = create_agent_details(details, description)
+    return ObservabilityBundle(
+        agent_details=agent_details,
+        caller_details=create_caller_details(details),
+        tenant_details=create_tenant_details(details),
+        request=create_request(details, message),
+        invoke_agent_details=create_invoke_agent_details(details, description, agent_details),
+    )
+
+
 def build_baggage_builder(context: TurnContext, correlation_id: Optional[str] = None) -> BaggageBuilder:
     """
     Build a BaggageBuilder populated from TurnContext activity.
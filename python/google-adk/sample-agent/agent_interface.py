@@ -28,4 +28,8 @@ class AgentInterface(ABC):
         self, message: str, auth: Authorization, auth_handler_name: str, context: TurnContext
     ) -> str:
         """Process a user message within an observability scope and return a response."""
-        pass
\ No newline at end of file
+        pass
+
+    async def close(self) -> None:
+        """Release long-lived resources such as pooled tool connections (called on shutdown)."""
+        pass
@@ -11,7 +11,7 @@ from aiohttp.web import Application, Request, Response, run_app
 from aiohttp.web_middlewares import middleware as web_middleware
 
 # Microsoft Agents SDK imports
-from microsoft_agents.hosting.core import AgentApplication, ClaimsIdentity, AuthenticationConstants
+from microsoft_agents.hosting.core import ClaimsIdentity, AuthenticationConstants
 from microsoft_agents.hosting.core.authorization import AgentAuthConfiguration
 from microsoft_agents.hosting.aiohttp import start_agent_process, jwt_authorization_middleware
 
@@ -28,7 +28,7 @@ log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INF
 logging.basicConfig(level=log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
-def start_server(agent_app: AgentApplication):
+def start_server(agent_app: MyAgent):
     """Start the agent application server."""
     isProduction = (
         os.getenv("WEBSITE_SITE_NAME") is not None       # Azure App Service
@@ -111,6 +111,12 @@ def start_server(agent_app: AgentApplication):
     app.router.add_post("/api/messages", entry_point)
     app["agent_configuration"] = agent_auth_config
 
+    # Close pooled MCP tool connections once, when the server shuts down
+    async def close_agent(app: Application):
+        await agent_app.agent.close()
+
+    app.on_cleanup.append(close_agent)
+
     try:
         host = "0.0.0.0" if isProduction else "localhost"
         
@@ -157,6 +163,13 @@ def main():
 
 
 if __name__ == "__main__":
+    # uvloop is a faster drop-in event loop; not available on Windows
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         main()
     except KeyboardInterrupt:
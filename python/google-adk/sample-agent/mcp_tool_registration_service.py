@@ -17,6 +17,27 @@ from microsoft_agents_a365.tooling.utils.utility import (
     get_mcp_platform_authentication_scope,
 )
 
+class CachedMcpToolset(McpToolset):
+    """
+    McpToolset that lists the server's tools once and reuses them.
+
+    ADK calls get_tools on every model request; the tool list only changes when
+    the server is redeployed, which in turn rebuilds the pooled toolset.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_tools = None
+
+    async def get_tools(self, readonly_context=None):
+        if self._cached_tools is None:
+            self._cached_tools = await super().get_tools(readonly_context)
+        return self._cached_tools
+
+    async def close(self):
+        self._cached_tools = None
+        await super().close()
+
 class McpToolRegistrationService:
     """Service for managing MCP tools and servers for an agent"""
 
@@ -38,6 +59,7 @@ class McpToolRegistrationService:
         auth_handler_name: str,
         context: TurnContext,
         auth_token: Optional[str] = None,
+        required_tools: Optional[set[str]] = None,
     ):
         """
         Add new MCP servers to the agent by creating a new Agent instance.
@@ -50,6 +72,7 @@ class McpToolRegistrationService:
             auth: Authorization object used to exchange tokens for MCP server access.
             context: TurnContext object representing the current turn/session context.
             auth_token: Authentication token to access the MCP servers. If not provided, will be obtained using `auth` and `context`.
+            required_tools: MCP server unique names to connect. If not provided, every configured server is connected.
 
         Returns:
             New Agent instance with all MCP servers
@@ -74,14 +97,20 @@ class McpToolRegistrationService:
             "Authorization": f"Bearer {auth_token}"
         }
 
+        remaining = set(required_tools) if required_tools else None
         for server_config in mcp_server_configs:
+            if remaining is not None:
+                if server_config.mcp_server_unique_name not in remaining:
+                    continue
+                remaining.discard(server_config.mcp_server_unique_name)
+
             if not server_config.url:
                 self._logger.warning(
                     "Skipping MCP server '%s' — no URL configured (dev mode or manifest-only config).",
                     server_config.mcp_server_unique_name,
                 )
                 continue
-            server_info = McpToolset(
+            server_info = CachedMcpToolset(
                 connection_params=StreamableHTTPConnectionParams(
                     url=server_config.url,
                     headers=mcp_server_headers
@@ -90,6 +119,13 @@ class McpToolRegistrationService:
 
             mcp_servers_info.append(server_info)
 
+            # Stop once every requested server is connected
+            if remaining is not None and not remaining:
+                break
+
+        if remaining:
+            self._logger.warning("Requested MCP servers not configured: %s", ", ".join(sorted(remaining)))
+
         all_tools = agent.tools + mcp_servers_info
 
         return Agent(
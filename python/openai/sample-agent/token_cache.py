@@ -6,26 +6,43 @@ Token caching utilities for Agent 365 Observability exporter authentication.
 """
 
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# Global token cache for Agent 365 Observability exporter
-_agentic_token_cache = {}
+# Cached tokens are treated as expired after this long; agentic tokens are issued
+# for about an hour, so this leaves a safety buffer before the real expiry
+DEFAULT_TOKEN_TTL_SECONDS = 3000
 
+# Global token cache for Agent 365 Observability exporter:
+# (tenant_id, agent_id) -> (token, expiry on the monotonic clock).
+# No lock: single dict get/set/pop calls are atomic under the GIL, and the
+# exporter's background thread reads this on every span batch.
+_agentic_token_cache: dict[tuple[str, str], tuple[str, float]] = {}
 
-def cache_agentic_token(tenant_id: str, agent_id: str, token: str) -> None:
+
+def cache_agentic_token(
+    tenant_id: str,
+    agent_id: str,
+    token: str,
+    ttl_seconds: float = DEFAULT_TOKEN_TTL_SECONDS,
+) -> None:
     """Cache the agentic token for use by Agent 365 Observability exporter."""
-    key = f"{tenant_id}:{agent_id}"
-    _agentic_token_cache[key] = token
-    logger.debug(f"Cached agentic token for {key}")
+    _agentic_token_cache[(tenant_id, agent_id)] = (token, time.monotonic() + ttl_seconds)
+    logger.debug("Cached agentic token for %s:%s", tenant_id, agent_id)
 
 
 def get_cached_agentic_token(tenant_id: str, agent_id: str) -> str | None:
-    """Retrieve cached agentic token for Agent 365 Observability exporter."""
-    key = f"{tenant_id}:{agent_id}"
-    token = _agentic_token_cache.get(key)
-    if token:
-        logger.debug(f"Retrieved cached agentic token for {key}")
-    else:
-        logger.debug(f"No cached token found for {key}")
+    """Retrieve cached agentic token for Agent 365 Observability exporter (None once expired)."""
+    key = (tenant_id, agent_id)
+    entry = _agentic_token_cache.get(key)
+    if entry is None:
+        logger.debug("No cached token found for %s:%s", tenant_id, agent_id)
+        return None
+
+    token, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _agentic_token_cache.pop(key, None)
+        logger.debug("Cached token expired for %s:%s", tenant_id, agent_id)
+        return None
     return token
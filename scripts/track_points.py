@@ -32,15 +32,29 @@ Points are calculated based on:
 
 import os
 import sys
+import functools
+import hashlib
 import json
 import re
+import tempfile
+import threading
 import yaml
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib json module is used without it
+    orjson = None
+
 # Configuration
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config_points.yml')
+# Validated config cached as JSON next to the YAML; reused while it is not older than the YAML
+CONFIG_CACHE_FILE = CONFIG_FILE + '.json'
 # GITHUB_TOKEN is provided by GitHub Actions with limited repository scope
 # It expires after workflow completion and is never logged or exposed
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
@@ -48,9 +62,43 @@ GITHUB_REPOSITORY = os.getenv('GITHUB_REPOSITORY')  # Format: owner/repo
 GITHUB_EVENT_NAME = os.getenv('GITHUB_EVENT_NAME')
 GITHUB_EVENT_PATH = os.getenv('GITHUB_EVENT_PATH')
 
+# One pooled HTTPS session for every GitHub API call in a run, so the TLS
+# connection is reused. Idempotent requests are retried on throttling and 5xx.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'Authorization': f'Bearer {GITHUB_TOKEN}',
+    'Accept': 'application/vnd.github.v3+json'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# On-disk ETag cache for conditional GETs, so unchanged resources come back as a bodyless 304
+ETAG_CACHE_DIR = os.getenv('POINTS_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'points_cache'))
+
+# Successful GET responses for this run, keyed by endpoint; cleared by any write
+_GET_CACHE: Dict[str, object] = {}
+
+# GraphQL endpoint, used to fetch all linked issues in a single round-trip
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# Most labels read per linked issue through GraphQL
+LINKED_ISSUE_LABELS_LIMIT = 20
+
+# Page size when scanning a PR's changed files for documentation
+PR_FILES_PAGE_SIZE = 30
+
+# Upper bound on GitHub API reads issued in parallel (within the session's pool size)
+MAX_PARALLEL_REQUESTS = 8
+
 # Comment identifier for finding the bot's tracking comment
 COMMENT_MARKER = "<!-- CONTRIBUTOR_POINTS_TRACKER -->"
 
+# Top-level event payload keys the tracker reads; the rest (repository, sender, ...) is dropped
+EVENT_KEYS = ('action', 'pull_request', 'issue', 'review')
+
 # Minimum character count for detailed review bonus
 DETAILED_REVIEW_MIN_CHARS = 100
 
@@ -60,15 +108,67 @@ PERFORMANCE_KEYWORDS = [
     'fast', 'faster', 'efficient', 'efficiency', 'speed'
 ]
 
+# All performance keywords in one case-insensitive pattern, so a review body is scanned once
+PERFORMANCE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, PERFORMANCE_KEYWORDS)), re.IGNORECASE)
+
+# Keywords that link issues: closes, fixes, resolves (case-insensitive)
+# Pattern matches: "closes #123", "fixes #456", "resolves #789", etc.; the only group is the issue number
+LINKED_ISSUE_RE = re.compile(r'\b(?:closes?|fixe[sd]|resolved?)\b\s*:?\s*#(\d+)', re.IGNORECASE)
+
+# Both words within one label; '.' never crosses the newline between joined label names
+HIGH_PRIORITY_LABEL_RE = re.compile(r'priority.*high|high.*priority')
+CRITICAL_BUG_LABEL_RE = re.compile(r'critical.*bug|bug.*critical')
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python loader
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def json_loads(data):
+    """Parse JSON text or bytes (with orjson when installed)."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj) -> str:
+    """Serialize to compact JSON text (with orjson when installed)."""
+    if orjson:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+def _load_cached_config() -> Optional[dict]:
+    """Return the JSON config cache if it is at least as new as the YAML, else None."""
+    try:
+        if os.path.getmtime(CONFIG_CACHE_FILE) >= os.path.getmtime(CONFIG_FILE):
+            with open(CONFIG_CACHE_FILE, 'rb') as f:
+                return json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_config_cache(config: dict) -> None:
+    """Atomically write the config cache; on failure the next run simply parses the YAML again."""
+    tmp_path = f'{CONFIG_CACHE_FILE}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json_dumps(config))
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load points configuration from YAML file."""
+    """Load points configuration from YAML file (parsed once per process)."""
     if not os.path.exists(CONFIG_FILE):
         print(f"ERROR: Config file not found: {CONFIG_FILE}", file=sys.stderr)
         sys.exit(1)
     
+    cached = _load_cached_config()
+    if cached is not None:
+        return cached
+    
     try:
         with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
         
         # Validate required keys exist
         required_keys = ['review_submission', 'detailed_review', 'approve_pr', 'pr_merged']
@@ -95,6 +195,7 @@ def load_config() -> dict:
             if key not in config['points']:
                 config['points'][key] = default_value
         
+        _write_config_cache(config)
         return config
     except Exception as e:
         print(f"ERROR: Failed to load config: {e}", file=sys.stderr)
@@ -107,9 +208,10 @@ def load_event() -> dict:
         sys.exit(1)
     
     try:
-        with open(GITHUB_EVENT_PATH, 'r', encoding='utf-8') as f:
-            event = json.load(f)
-        return event
+        with open(GITHUB_EVENT_PATH, 'rb') as f:
+            event = json_loads(f.read())
+        # Keep only the subtrees the tracker uses so the rest can be freed right away
+        return {key: event[key] for key in EVENT_KEYS if key in event}
     except Exception as e:
         print(f"ERROR: Failed to load event: {e}", file=sys.stderr)
         sys.exit(1)
@@ -140,24 +242,62 @@ def is_issue_event(event: dict) -> bool:
     """Check if this is an issue event (not a PR)."""
     return GITHUB_EVENT_NAME == 'issues' or (GITHUB_EVENT_NAME == 'issue_comment' and 'issue' in event and 'pull_request' not in event['issue'])
 
+def _etag_cache_path(url: str) -> str:
+    """Helper: Path of the on-disk conditional-request cache entry for a URL."""
+    return os.path.join(ETAG_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+def _read_etag_cache(url: str) -> Optional[Tuple[str, object]]:
+    """Helper: Return the stored (etag, body) for a URL, or None if there is no usable entry."""
+    try:
+        with open(_etag_cache_path(url), 'rb') as f:
+            entry = json_loads(f.read())
+        return entry['etag'], entry['body']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _write_etag_cache(url: str, etag: str, body: object) -> None:
+    """Helper: Atomically store a response body with its ETag; failures are ignored."""
+    path = _etag_cache_path(url)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(ETAG_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json_dumps({'etag': etag, 'body': body}))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 def github_api_request(method: str, endpoint: str, data: Optional[dict] = None) -> dict:
-    """Make GitHub API request."""
+    """Make GitHub API request (GETs are served from the per-run cache when possible)."""
+    if method == 'GET':
+        if endpoint in _GET_CACHE:
+            return _GET_CACHE[endpoint]
+    else:
+        # A write may change any listing fetched earlier (e.g. issues/{pr}/comments)
+        _GET_CACHE.clear()
+    
     url = f"https://api.github.com/repos/{GITHUB_REPOSITORY}/{endpoint}"
-    headers = {
-        'Authorization': f'Bearer {GITHUB_TOKEN}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
     
     try:
-        if method == 'GET':
-            response = requests.get(url, headers=headers)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data)
-        elif method == 'PATCH':
-            response = requests.patch(url, headers=headers, json=data)
+        etag_cached = _read_etag_cache(url) if method == 'GET' else None
+        headers = {'If-None-Match': etag_cached[0]} if etag_cached else None
         
-        response.raise_for_status()
-        return response.json() if response.text else {}
+        response = _SESSION.request(method, url, json=data, headers=headers)
+        if etag_cached and response.status_code == 304:
+            # Unchanged since the stored response: no body was sent and no rate limit was spent
+            result = etag_cached[1]
+        else:
+            response.raise_for_status()
+            result = json_loads(response.content) if response.content else {}
+            if method == 'GET' and response.headers.get('ETag'):
+                _write_etag_cache(url, response.headers['ETag'], result)
+        
+        if method == 'GET':
+            _GET_CACHE[endpoint] = result
+        return result
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 401:
             print(f"ERROR: Authentication failed - check GITHUB_TOKEN", file=sys.stderr)
@@ -172,6 +312,29 @@ def github_api_request(method: str, endpoint: str, data: Optional[dict] = None)
         print(f"ERROR: GitHub API request failed: {e}", file=sys.stderr)
         return {}
 
+def github_graphql_request(query: str, variables: Optional[dict] = None) -> Optional[dict]:
+    """Run a read-only GitHub GraphQL query; returns its data, or None if it failed."""
+    try:
+        response = _SESSION.post(GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables or {}})
+        response.raise_for_status()
+        payload = json_loads(response.content)
+    except Exception as e:
+        print(f"ERROR: GitHub GraphQL request failed: {e}", file=sys.stderr)
+        return None
+    
+    if payload.get('errors') or not isinstance(payload.get('data'), dict):
+        print(f"ERROR: GitHub GraphQL query returned errors: {payload.get('errors')}", file=sys.stderr)
+        return None
+    return payload['data']
+
+def github_api_get_many(endpoints: List[str]) -> list:
+    """GET independent endpoints concurrently; results are returned in the same order."""
+    if len(endpoints) <= 1:
+        return [github_api_request('GET', endpoint) for endpoint in endpoints]
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(endpoints))) as executor:
+        return list(executor.map(lambda endpoint: github_api_request('GET', endpoint), endpoints))
+
 def get_all_pr_activity(pr_number: int) -> Tuple[List[dict], List[dict], dict]:
     """
     Fetch all activity on a PR: reviews, comments, and PR details.
@@ -179,9 +342,11 @@ def get_all_pr_activity(pr_number: int) -> Tuple[List[dict], List[dict], dict]:
     Returns:
         Tuple of (reviews, comments, pr_details)
     """
-    reviews = github_api_request('GET', f'pulls/{pr_number}/reviews')
-    comments = github_api_request('GET', f'issues/{pr_number}/comments')
-    pr_details = github_api_request('GET', f'pulls/{pr_number}')
+    reviews, comments, pr_details = github_api_get_many([
+        f'pulls/{pr_number}/reviews',
+        f'issues/{pr_number}/comments',
+        f'pulls/{pr_number}'
+    ])
     
     return (
         reviews if isinstance(reviews, list) else [],
@@ -201,8 +366,7 @@ def calculate_review_points(review: dict, config: dict) -> Tuple[int, List[str]]
         breakdown.append(f'Detailed feedback ({len(body)} characters): +5 points')
     
     # Performance improvement suggestion bonus
-    body_lower = body.lower()
-    if any(keyword in body_lower for keyword in PERFORMANCE_KEYWORDS):
+    if PERFORMANCE_KEYWORDS_RE.search(body):
         bonus = config['points'].get('performance_improvement', 6)
         points += bonus
         breakdown.append(f'Performance improvement suggestion: +{bonus} points')
@@ -214,32 +378,47 @@ def calculate_review_points(review: dict, config: dict) -> Tuple[int, List[str]]
     
     return points, breakdown
 
-def _check_label_in_issues(linked_issues: List[dict], label_keywords: List[str]) -> Optional[Tuple[bool, str]]:
-    """Helper: Check if any linked issue has labels matching keywords."""
-    for issue in linked_issues:
-        issue_labels = [label['name'].lower() for label in issue.get('labels', [])]
-        if any(keyword in label for keyword in label_keywords for label in issue_labels):
-            return True, f'closes issue #{issue["number"]}'
+def _label_text(item: dict) -> str:
+    """
+    Helper: Lowercased label names of a PR or issue, one per line.
+    
+    One substring test then covers every label, and a keyword can never match across two labels.
+    """
+    return '\n'.join(label['name'].lower() for label in item.get('labels', []))
+
+def _check_label_in_issues(linked_issue_labels: List[Tuple[int, str]], label_keywords: List[str]) -> Optional[Tuple[bool, str]]:
+    """Helper: Check if any linked issue, given as (number, label text) pairs, has labels matching keywords."""
+    for issue_number, issue_label_text in linked_issue_labels:
+        if any(keyword in issue_label_text for keyword in label_keywords):
+            return True, f'closes issue #{issue_number}'
     return False, ''
 
 def _has_documentation_changes(pr_number: int) -> bool:
     """Helper: Check if PR modifies documentation files."""
-    files = github_api_request('GET', f'pulls/{pr_number}/files')
-    if isinstance(files, list):
-        return any(
-            'readme' in f['filename'].lower() or
-            'docs/' in f['filename'].lower() or
-            f['filename'].lower().endswith('.md')
-            for f in files if f.get('additions', 0) > 0
-        )
-    return False
+    page = 1
+    while True:
+        files = github_api_request('GET', f'pulls/{pr_number}/files?per_page={PR_FILES_PAGE_SIZE}&page={page}')
+        if not isinstance(files, list):
+            return False
+        
+        # Stop at the first documentation file with additions instead of reading further pages
+        for f in files:
+            if f.get('additions', 0) > 0:
+                filename = f['filename'].lower()
+                if 'readme' in filename or 'docs/' in filename or filename.endswith('.md'):
+                    return True
+        
+        if len(files) < PR_FILES_PAGE_SIZE:
+            return False
+        page += 1
 
 def calculate_pr_author_points(pr_details: dict, config: dict) -> Tuple[int, List[str]]:
     """Calculate points for PR author based on PR characteristics."""
     points = 0
     breakdown = []
-    labels = [label['name'].lower() for label in pr_details.get('labels', [])]
-    linked_issues = get_linked_issues(pr_details)
+    label_text = _label_text(pr_details)
+    # Each linked issue's labels are lowercased once and reused by every check below
+    linked_issue_labels = [(issue['number'], _label_text(issue)) for issue in get_linked_issues(pr_details)]
     
     # PR merged
     if pr_details.get('merged'):
@@ -247,18 +426,18 @@ def calculate_pr_author_points(pr_details: dict, config: dict) -> Tuple[int, Lis
         breakdown.append('PR merged: +5 points')
     
     # Bug fix bonus
-    found, source = _check_label_in_issues(linked_issues, ['bug'])
+    found, source = _check_label_in_issues(linked_issue_labels, ['bug'])
     if found:
         bonus = config['points'].get('bug_fix', 5)
         points += bonus
         breakdown.append(f'Bug fix ({source}): +{bonus} points')
     
     # Security fix bonus
-    has_security = any('security' in label or 'vulnerability' in label for label in labels)
+    has_security = 'security' in label_text or 'vulnerability' in label_text
     breakdown_source = 'PR labeled' if has_security else ''
     
     if not has_security:
-        found, source = _check_label_in_issues(linked_issues, ['security', 'vulnerability'])
+        found, source = _check_label_in_issues(linked_issue_labels, ['security', 'vulnerability'])
         has_security, breakdown_source = found, source
     
     if has_security:
@@ -267,8 +446,9 @@ def calculate_pr_author_points(pr_details: dict, config: dict) -> Tuple[int, Lis
         breakdown.append(f'Security fix ({breakdown_source}): +{bonus} points')
     
     # Documentation bonus
-    has_docs = any('documentation' in label or 'docs' in label for label in labels)
-    if not has_docs and pr_details.get('number'):
+    has_docs = 'documentation' in label_text or 'docs' in label_text
+    # The files listing is only fetched when no label decides it and the PR changes files
+    if not has_docs and pr_details.get('number') and pr_details.get('changed_files', 1) > 0:
         has_docs = _has_documentation_changes(pr_details['number'])
     
     if has_docs:
@@ -284,21 +464,51 @@ def calculate_pr_author_points(pr_details: dict, config: dict) -> Tuple[int, Lis
     
     return points, breakdown
 
+def _get_issues_graphql(issue_numbers: List[int]) -> Optional[List[dict]]:
+    """
+    Helper: Fetch the number and labels of several issues with one aliased GraphQL query.
+    
+    Returns the issues in the REST shape read by _label_text, or None on failure.
+    """
+    owner, _, name = (GITHUB_REPOSITORY or '').partition('/')
+    if not owner or not name:
+        return None
+    
+    fields = f'number labels(first: {LINKED_ISSUE_LABELS_LIMIT}) {{ nodes {{ name }} }}'
+    selections = ' '.join(
+        f'i{number}: issueOrPullRequest(number: {number}) {{ ... on Issue {{ {fields} }} ... on PullRequest {{ {fields} }} }}'
+        for number in issue_numbers
+    )
+    query = f'query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {selections} }} }}'
+    
+    data = github_graphql_request(query, {'owner': owner, 'name': name})
+    repository = data.get('repository') if data else None
+    if not isinstance(repository, dict):
+        return None
+    
+    issues = []
+    for number in issue_numbers:
+        node = repository.get(f'i{number}')
+        if node:
+            issues.append({'number': node['number'], 'labels': node['labels']['nodes']})
+    return issues
+
 def get_linked_issues(pr_details: dict) -> List[dict]:
     """Get issues linked to this PR by checking PR body for closing keywords."""
     linked_issues = []
     pr_body = pr_details.get('body', '') or ''
     
-    # Keywords that link issues: closes, fixes, resolves (case-insensitive)
-    # Pattern matches: "closes #123", "fixes #456", "resolves #789", etc.
-    pattern = r'\b(closes?|fixe[sd]|resolved?)\b\s*:?\s*#(\d+)'
-    matches = re.findall(pattern, pr_body, re.IGNORECASE)
+    # Linked issue numbers, once each and in order
+    issue_numbers = list(dict.fromkeys(int(number) for number in LINKED_ISSUE_RE.findall(pr_body)))
+    if not issue_numbers:
+        return linked_issues
     
-    # Extract just the issue numbers (group 2 from the matches)
-    issue_numbers = [match[1] for match in matches]
+    issues = _get_issues_graphql(issue_numbers)
+    if issues is None:
+        # Fall back to one REST request per issue
+        issues = github_api_get_many([f'issues/{issue_number}' for issue_number in issue_numbers])
     
-    for issue_number in issue_numbers:
-        issue = github_api_request('GET', f'issues/{issue_number}')
+    for issue in issues:
         if issue and isinstance(issue, dict):
             linked_issues.append(issue)
     
@@ -317,46 +527,54 @@ def calculate_issue_creator_points(issue: dict, config: dict) -> Tuple[int, List
     points = 0
     breakdown = []
     
-    labels = [label['name'].lower() for label in issue.get('labels', [])]
+    label_text = _label_text(issue)
     
     # High priority issue creation
-    if any('priority' in label and 'high' in label for label in labels):
+    if HIGH_PRIORITY_LABEL_RE.search(label_text):
         bonus = config['points'].get('high_priority', 3)
         points += bonus
         breakdown.append(f'High priority issue created: +{bonus} points')
     
     # Critical bug issue
-    if any('critical' in label and 'bug' in label for label in labels):
+    if CRITICAL_BUG_LABEL_RE.search(label_text):
         bonus = config['points'].get('critical_bug', 10)
         points += bonus
         breakdown.append(f'Critical bug reported: +{bonus} points')
     
     # Security vulnerability reported
-    if any('security' in label or 'vulnerability' in label for label in labels):
+    if 'security' in label_text or 'vulnerability' in label_text:
         bonus = config['points'].get('security_fix', 15)
         points += bonus
         breakdown.append(f'Security vulnerability reported: +{bonus} points')
     
     return points, breakdown
 
+def _add_activity(contributors: Dict[str, dict], username: str, activity: dict):
+    """Helper: Record an activity for a contributor and render its comment lines right away."""
+    data = contributors.setdefault(username, {'total': 0, 'activities': [], 'lines': []})
+    data['total'] += activity['points']
+    data['activities'].append(activity)
+    
+    timestamp_str = _format_timestamp(activity.get('timestamp') or '')
+    data['lines'].append(f"**{activity['type'].replace('_', ' ').title()}** ({timestamp_str}):")
+    data['lines'].extend(f"- ✅ {item}" for item in activity['breakdown'])
+    data['lines'].append("")
+
 def aggregate_contributor_points(reviews: List[dict], pr_details: dict, config: dict) -> Dict[str, dict]:
     """
     Aggregate points for all contributors on a PR.
     
     Returns:
-        Dict mapping username to {'total': int, 'activities': [list of activity dicts]}
+        Dict mapping username to {'total': int, 'activities': [list of activity dicts],
+        'lines': [comment markdown for those activities]}
     """
     contributors = {}
     
     # Process reviews
     for review in reviews:
         username = review['user']['login']
-        if username not in contributors:
-            contributors[username] = {'total': 0, 'activities': []}
-        
         points, breakdown = calculate_review_points(review, config)
-        contributors[username]['total'] += points
-        contributors[username]['activities'].append({
+        _add_activity(contributors, username, {
             'type': 'review',
             'points': points,
             'breakdown': breakdown,
@@ -369,11 +587,7 @@ def aggregate_contributor_points(reviews: List[dict], pr_details: dict, config:
     if pr_author:
         author_points, author_breakdown = calculate_pr_author_points(pr_details, config)
         if author_points > 0:
-            if pr_author not in contributors:
-                contributors[pr_author] = {'total': 0, 'activities': []}
-            
-            contributors[pr_author]['total'] += author_points
-            contributors[pr_author]['activities'].append({
+            _add_activity(contributors, pr_author, {
                 'type': 'pr_author',
                 'points': author_points,
                 'breakdown': author_breakdown,
@@ -391,35 +605,42 @@ def _format_timestamp(timestamp: str) -> str:
     except Exception:
         return timestamp.split('T')[0] if timestamp else 'Unknown date'
 
+# Static heading of the comment footer that explains the points
+POINTS_FOOTER_HEADING = ("---", "", "### How Points Are Calculated", "")
+
+# Rows of the footer's points table: (action, config key, default points, shown as a bonus)
+POINTS_TABLE_ROWS = (
+    ('Review submission', 'review_submission', 5, False),
+    ('Detailed review (100+ chars)', 'detailed_review', 5, True),
+    ('Performance improvement suggestion', 'performance_improvement', 6, True),
+    ('PR approval', 'approve_pr', 3, True),
+    ('PR merged', 'pr_merged', 5, False),
+    ('Bug fix (closes issue)', 'bug_fix', 5, True),
+    ('Security fix/vulnerability', 'security_fix', 15, True),
+    ('Documentation', 'documentation', 4, True),
+    ('First-time contributor', 'first_time_contributor', 5, True),
+    ('High priority issue created', 'high_priority', 3, True),
+    ('Critical bug reported', 'critical_bug', 10, True),
+)
+
 def _build_points_table(config: dict) -> str:
     """Helper: Build the points calculation table from config."""
     points_config = config.get('points', {})
-    table = "| Action | Points |\n|--------|--------|\n"
-    
-    points_map = [
-        ('Review submission', points_config.get('review_submission', 5), False),
-        ('Detailed review (100+ chars)', points_config.get('detailed_review', 5), True),
-        ('Performance improvement suggestion', points_config.get('performance_improvement', 6), True),
-        ('PR approval', points_config.get('approve_pr', 3), True),
-        ('PR merged', points_config.get('pr_merged', 5), False),
-        ('Bug fix (closes issue)', points_config.get('bug_fix', 5), True),
-        ('Security fix/vulnerability', points_config.get('security_fix', 15), True),
-        ('Documentation', points_config.get('documentation', 4), True),
-        ('First-time contributor', points_config.get('first_time_contributor', 5), True),
-        ('High priority issue created', points_config.get('high_priority', 3), True),
-        ('Critical bug reported', points_config.get('critical_bug', 10), True),
-    ]
+    rows = ["| Action | Points |", "|--------|--------|"]
     
-    for action, points, is_bonus in points_map:
+    for action, key, default, is_bonus in POINTS_TABLE_ROWS:
+        points = points_config.get(key, default)
         value = f"+{points} bonus" if is_bonus else str(points)
-        table += f"| {action} | {value} |\n"
+        rows.append(f"| {action} | {value} |")
     
-    return table
+    return '\n'.join(rows) + '\n'
 
 def format_comment_body(pr_number: int, contributors: Dict[str, dict], config: dict) -> str:
     """Format the PR comment body with points tracking."""
     total_points = sum(c['total'] for c in contributors.values())
-    timestamp = datetime.now(timezone.utc).strftime('%B %d, %Y at %I:%M %p UTC')
+    # One clock read, so the visible timestamp and the metadata always agree
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime('%B %d, %Y at %I:%M %p UTC')
     
     # Header
     lines = [
@@ -438,19 +659,12 @@ def format_comment_body(pr_number: int, contributors: Dict[str, dict], config: d
     for username, data in sorted_contributors:
         lines.append(f"#### @{username} - **{data['total']} points**")
         lines.append("")
-        
-        for activity in data['activities']:
-            timestamp_str = _format_timestamp(activity.get('timestamp', ''))
-            lines.append(f"**{activity['type'].replace('_', ' ').title()}** ({timestamp_str}):")
-            lines.extend(f"- ✅ {item}" for item in activity['breakdown'])
-            lines.append("")
+        # Activity lines were rendered while aggregating
+        lines.extend(data['lines'])
     
     # Footer
+    lines.extend(POINTS_FOOTER_HEADING)
     lines.extend([
-        "---",
-        "",
-        "### How Points Are Calculated",
-        "",
         _build_points_table(config),
         f"*Last updated: {timestamp}*",
         ""
@@ -464,27 +678,19 @@ def format_comment_body(pr_number: int, contributors: Dict[str, dict], config: d
             username: {'total': data['total'], 'activity_count': len(data['activities'])}
             for username, data in contributors.items()
         },
-        'last_updated': datetime.now(timezone.utc).isoformat()
+        'last_updated': now.isoformat()
     }
     lines.append(f"<!-- POINTS_DATA\n{json.dumps(metadata, indent=2)}\n-->")
     
     return '\n'.join(lines)
 
-def find_existing_comment(pr_number: int) -> Optional[int]:
-    """Find the bot's existing tracking comment on the PR."""
-    comments = github_api_request('GET', f'issues/{pr_number}/comments')
-    if not isinstance(comments, list):
-        return None
-    
-    for comment in comments:
-        if COMMENT_MARKER in comment.get('body', ''):
-            return comment['id']
-    
-    return None
+def find_existing_comment(comments: List[dict]) -> Optional[int]:
+    """Find the bot's existing tracking comment among the PR's already-fetched comments."""
+    return next((comment['id'] for comment in comments if COMMENT_MARKER in (comment.get('body') or '')), None)
 
-def update_or_create_comment(pr_number: int, body: str):
+def update_or_create_comment(pr_number: int, body: str, comments: List[dict]):
     """Update existing tracking comment or create a new one."""
-    existing_comment_id = find_existing_comment(pr_number)
+    existing_comment_id = find_existing_comment(comments)
     
     if existing_comment_id:
         # Update existing comment
@@ -557,7 +763,7 @@ def main():
     
     # Format and update comment
     comment_body = format_comment_body(pr_number, contributors, config)
-    update_or_create_comment(pr_number, comment_body)
+    update_or_create_comment(pr_number, comment_body, comments)
     
     print("✅ Points tracking complete!")
     print("ℹ️  External pipeline can parse comment metadata for Kusto ingestion")